@@ -1,35 +1,14 @@
-from codeforms.export import ExportFormat, form_to_json_schema
-from codeforms.fields import (
-    CheckboxField,
-    CheckboxGroupField,
-    DateField,
-    DependentOptionsConfig,
-    EmailField,
-    FieldGroup,
-    FieldType,
-    FileField,
-    FormFieldBase,
-    FormStep,
-    HiddenField,
-    ListField,
-    ObjectListField,
-    NumberField,
-    RadioField,
-    SelectField,
-    SelectOption,
-    TextareaField,
-    TextField,
-    UrlField,
-    ValidationRule,
-    VisibilityRule,
-)
-from codeforms.forms import (
-    Form,
-    FormDataValidator,
-    evaluate_visibility,
-    validate_form_data,
-    validate_form_data_dynamic,
-)
+"""
+codeforms — forms defined, validated and exported with Pydantic.
+
+The Pydantic-backed models (fields, Form, exporters) are imported lazily on
+first attribute access (PEP 562), so ``import codeforms`` and the i18n /
+registry helpers do not pay for building the model graph.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from codeforms.i18n import (
     get_available_locales,
     get_locale,
@@ -37,12 +16,101 @@ from codeforms.i18n import (
     register_locale,
     set_locale,
     t,
+    use_locale,
 )
 from codeforms.registry import (
     get_registered_field_types,
     register_field_type,
 )
 
+if TYPE_CHECKING:
+    from codeforms.export import ExportFormat, form_to_json_schema
+    from codeforms.fields import (
+        CheckboxField,
+        CheckboxGroupField,
+        DateField,
+        DependentOptionsConfig,
+        EmailField,
+        FieldGroup,
+        FieldType,
+        FileField,
+        FormFieldBase,
+        FormStep,
+        HiddenField,
+        ListField,
+        NumberField,
+        ObjectListField,
+        RadioField,
+        SelectField,
+        SelectOption,
+        TextareaField,
+        TextField,
+        UrlField,
+        ValidationRule,
+        VisibilityRule,
+    )
+    from codeforms.forms import (
+        Form,
+        FormDataValidator,
+        evaluate_visibility,
+        validate_form_data,
+        validate_form_data_dynamic,
+    )
+
+# Public name → module that defines it, resolved on first access.
+_LAZY_IMPORTS = {
+    "ExportFormat": "codeforms.export",
+    "form_to_json_schema": "codeforms.export",
+    "CheckboxField": "codeforms.fields",
+    "CheckboxGroupField": "codeforms.fields",
+    "DateField": "codeforms.fields",
+    "DependentOptionsConfig": "codeforms.fields",
+    "EmailField": "codeforms.fields",
+    "FieldGroup": "codeforms.fields",
+    "FieldType": "codeforms.fields",
+    "FileField": "codeforms.fields",
+    "FormFieldBase": "codeforms.fields",
+    "FormStep": "codeforms.fields",
+    "HiddenField": "codeforms.fields",
+    "ListField": "codeforms.fields",
+    "NumberField": "codeforms.fields",
+    "ObjectListField": "codeforms.fields",
+    "RadioField": "codeforms.fields",
+    "SelectField": "codeforms.fields",
+    "SelectOption": "codeforms.fields",
+    "TextareaField": "codeforms.fields",
+    "TextField": "codeforms.fields",
+    "UrlField": "codeforms.fields",
+    "ValidationRule": "codeforms.fields",
+    "VisibilityRule": "codeforms.fields",
+    "Form": "codeforms.forms",
+    "FormDataValidator": "codeforms.forms",
+    "evaluate_visibility": "codeforms.forms",
+    "validate_form_data": "codeforms.forms",
+    "validate_form_data_dynamic": "codeforms.forms",
+}
+
+
+# Submodules that used to be bound by the eager imports above; kept reachable
+# as attributes (``codeforms.fields``) but imported on first access.
+_LAZY_SUBMODULES = frozenset({"export", "fields", "forms"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     # Field types and base
     "FieldType",
@@ -79,6 +147,7 @@ __all__ = [
     # i18n
     "t",
     "set_locale",
+    "use_locale",
     "get_locale",
     "get_available_locales",
     "register_locale",
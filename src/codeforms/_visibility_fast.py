@@ -0,0 +1,138 @@
+"""
+Reference evaluator for visible_when rules.
+
+Rules arrive pre-reduced to ``(field_name, op_code, value)`` tuples (see
+``codeforms.forms``), so evaluation is plain dispatch plus comparisons.
+The module is fully typed and free of dynamic features so it can be
+compiled with mypyc::
+
+    mypyc src/codeforms/_visibility_fast.py
+
+A compiled extension placed next to this file is picked up automatically
+by the import system; without it this pure-Python version is used.
+"""
+
+from __future__ import annotations
+
+import operator
+from typing import (
+    Callable,
+    Container,
+    Dict,
+    Final,
+    FrozenSet,
+    Mapping,
+    Protocol,
+    Tuple,
+    cast,
+)
+
+EQUALS: Final = 0
+NOT_EQUALS: Final = 1
+IN: Final = 2
+NOT_IN: Final = 3
+GT: Final = 4
+LT: Final = 5
+IS_EMPTY: Final = 6
+IS_NOT_EMPTY: Final = 7
+
+OP_CODES: Final[Dict[str, int]] = {
+    "equals": EQUALS,
+    "not_equals": NOT_EQUALS,
+    "in": IN,
+    "not_in": NOT_IN,
+    "gt": GT,
+    "lt": LT,
+    "is_empty": IS_EMPTY,
+    "is_not_empty": IS_NOT_EMPTY,
+}
+
+_EMPTY: Final[FrozenSet[object]] = frozenset({None, ""})
+
+
+# Only for the gt/lt casts: the rule value decides what the comparison means.
+class _Ordered(Protocol):
+    def __gt__(self, other: object, /) -> object: ...
+
+    def __lt__(self, other: object, /) -> object: ...
+
+
+def freeze_members(value: object) -> object:
+    """Freeze the target of an in/not_in rule into a frozenset when possible.
+
+    Only lists, tuples and sets of hashable values are frozen; anything else
+    (e.g. a string, which keeps substring semantics) is returned unchanged.
+    """
+    if not value:
+        return ()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        try:
+            return frozenset(value)
+        except TypeError:
+            return value
+    return value
+
+
+def op_in(field_value: object, value: object) -> bool:
+    try:
+        return field_value in cast(Container[object], value)
+    except TypeError:
+        # An unhashable value is never a member of a frozenset of hashables
+        if isinstance(value, frozenset):
+            return False
+        raise
+
+
+def op_not_in(field_value: object, value: object) -> bool:
+    try:
+        return field_value not in cast(Container[object], value)
+    except TypeError:
+        if isinstance(value, frozenset):
+            return True
+        raise
+
+
+def op_gt(field_value: object, value: object) -> bool:
+    return field_value is not None and bool(cast(_Ordered, field_value) > value)
+
+
+def op_lt(field_value: object, value: object) -> bool:
+    return field_value is not None and bool(cast(_Ordered, field_value) < value)
+
+
+def op_is_empty(field_value: object, value: object) -> bool:
+    try:
+        return field_value in _EMPTY
+    except TypeError:  # list/dict: only the empty list counts as empty
+        return field_value == []
+
+
+def op_is_not_empty(field_value: object, value: object) -> bool:
+    try:
+        return field_value not in _EMPTY
+    except TypeError:
+        return field_value != []
+
+
+# Indexed by op code. equals/not_equals map straight to the C-level
+# operator functions; the rest need a None or hashability guard that the
+# bare operator functions (operator.gt, operator.contains) would not apply.
+_OPS_BY_INT: Final[Tuple[Callable[[object, object], object], ...]] = (
+    operator.eq,
+    operator.ne,
+    op_in,
+    op_not_in,
+    op_gt,
+    op_lt,
+    op_is_empty,
+    op_is_not_empty,
+)
+
+
+def evaluate(
+    rules: Tuple[Tuple[str, int, object], ...], data: Mapping[str, object]
+) -> bool:
+    """Return True when every ``(field_name, op_code, value)`` rule holds."""
+    get = data.get
+    ops = _OPS_BY_INT
+    return all(ops[op](get(name), value) for name, op, value in rules)
@@ -1,6 +1,7 @@
 from enum import Enum
 from typing import Any, Dict
 
+from codeforms import i18n_keys as keys
 from codeforms.fields import (
     CheckboxField,
     CheckboxGroupField,
@@ -31,6 +32,13 @@ class ExportFormat(Enum):
     JSON_SCHEMA = "json_schema"
 
 
+# Precalculados al importar: se consultan una vez por campo/grupo/paso
+_BOOTSTRAP_FORMATS = frozenset(
+    (ExportFormat.BOOTSTRAP4.value, ExportFormat.BOOTSTRAP5.value)
+)
+_SELECTED = 'selected="selected"'
+
+
 def generate_validation_code(form, output_format: str) -> str:
     """Genera el código de validación en Javascript"""
     if output_format == "html":
@@ -43,7 +51,7 @@ def generate_validation_code(form, output_format: str) -> str:
             {js_generate_field_validations(form)}
 
             if (errors.length > 0) {{
-                alert('{t("export.fix_errors")}\\n' + errors.join('\\n'));
+                alert('{t(keys.EXPORT_FIX_ERRORS)}\\n' + errors.join('\\n'));
                 return false;
             }}
             return true;
@@ -72,7 +80,7 @@ def js_generate_field_validations(form) -> str:
         if field.required:
             field_validation += f"""
             if (!{field.name}) {{
-                errors.push('{t("export.field_required", label=field.label)}');
+                errors.push('{t(keys.EXPORT_FIELD_REQUIRED, label=field.label)}');
             }}
             """
 
@@ -150,10 +158,7 @@ def step_exporter(step, output_format: str, **kwargs) -> str:
 def group_to_html(group, **kwargs) -> str:
     """Genera la representación HTML del grupo de campos usando fieldset y legend"""
     output_format = kwargs.get("output_format", ExportFormat.HTML.value)
-    is_bootstrap = output_format in [
-        ExportFormat.BOOTSTRAP4.value,
-        ExportFormat.BOOTSTRAP5.value,
-    ]
+    is_bootstrap = output_format in _BOOTSTRAP_FORMATS
 
     # Clases CSS para el fieldset
     fieldset_class = (
@@ -181,14 +186,16 @@ def group_to_html(group, **kwargs) -> str:
         desc_class = "text-muted small mb-3" if is_bootstrap else "group-description"
         description_html = f'<p class="{desc_class}">{group.description}</p>'
 
-    # Construir el HTML del fieldset
-    html = f"<fieldset {attrs_str}>"
-    html += f'<legend class="{legend_class}">{group.title}</legend>'
-    html += description_html
-    html += fields_html
-    html += "</fieldset>"
-
-    return html
+    # Construir el HTML del fieldset con un único join
+    return "".join(
+        (
+            f"<fieldset {attrs_str}>",
+            f'<legend class="{legend_class}">{group.title}</legend>',
+            description_html,
+            fields_html,
+            "</fieldset>",
+        )
+    )
 
 
 def step_to_html(step, **kwargs) -> str:
@@ -197,10 +204,7 @@ def step_to_html(step, **kwargs) -> str:
     Diferente de FieldGroup (que usa <fieldset>) para distinguir semánticamente.
     """
     output_format = kwargs.get("output_format", ExportFormat.HTML.value)
-    is_bootstrap = output_format in [
-        ExportFormat.BOOTSTRAP4.value,
-        ExportFormat.BOOTSTRAP5.value,
-    ]
+    is_bootstrap = output_format in _BOOTSTRAP_FORMATS
 
     # Clases CSS para el section
     step_class = (
@@ -237,24 +241,21 @@ def step_to_html(step, **kwargs) -> str:
         desc_class = "text-muted mb-3" if is_bootstrap else "step-description"
         description_html = f'<p class="{desc_class}">{step.description}</p>'
 
-    html = f"<section {attrs_str}>"
-    html += f'<h2 class="{title_class}">{step.title}</h2>'
-    html += description_html
-    html += content_html
-    html += "</section>"
-
-    return html
+    return "".join(
+        (
+            f"<section {attrs_str}>",
+            f'<h2 class="{title_class}">{step.title}</h2>',
+            description_html,
+            content_html,
+            "</section>",
+        )
+    )
 
 
 def form_to_html(form: Form, **kwargs) -> str:
     """Genera el HTML completo del formulario"""
     output_format = kwargs.get("output_format", ExportFormat.HTML.value)
-    form_class = (
-        "needs-validation"
-        if output_format
-        in [ExportFormat.BOOTSTRAP4.value, ExportFormat.BOOTSTRAP5.value]
-        else ""
-    )
+    form_class = "needs-validation" if output_format in _BOOTSTRAP_FORMATS else ""
 
     # Detectar si es wizard
     is_wizard = any(isinstance(item, FormStep) for item in form.content)
@@ -285,30 +286,18 @@ def form_to_html(form: Form, **kwargs) -> str:
     content_html = "\n".join(content_html_parts)
 
     if kwargs.get("submit"):
-        submit_class = (
-            "btn btn-primary"
-            if output_format
-            in [ExportFormat.BOOTSTRAP4.value, ExportFormat.BOOTSTRAP5.value]
-            else ""
-        )
-        submit_html = f'<button type="submit" class="{submit_class}">{t("export.submit")}</button>'
+        submit_class = "btn btn-primary" if output_format in _BOOTSTRAP_FORMATS else ""
+        submit_html = f'<button type="submit" class="{submit_class}">{t(keys.EXPORT_SUBMIT)}</button>'
     else:
         submit_html = ""
 
-    html = f"<form {attrs_str}>"
-    html += f"\t{content_html}"
-    html += f"\t{submit_html}"
-    html += "</form>"
-    return html
+    return f"<form {attrs_str}>\t{content_html}\t{submit_html}</form>"
 
 
 def field_to_html(field: FormFieldBase, **kwargs) -> str:
     """Genera la representación HTML del campo"""
     output_format = kwargs.get("output_format", ExportFormat.HTML.value)
-    is_bootstrap = output_format in [
-        ExportFormat.BOOTSTRAP4.value,
-        ExportFormat.BOOTSTRAP5.value,
-    ]
+    is_bootstrap = output_format in _BOOTSTRAP_FORMATS
 
     # Clases base para Bootstrap 4/5
     if is_bootstrap:
@@ -359,11 +348,13 @@ def field_to_html(field: FormFieldBase, **kwargs) -> str:
         # Generar opciones
         options_html = ""
         if hasattr(field, "options"):
-            for option in field.options:
-                selected = 'selected="selected"' if option.selected else ""
-                options_html += (
-                    f'<option value="{option.value}" {selected}>{option.label}</option>'
-                )
+            # Un solo join sobre un generador: evita la concatenación
+            # cuadrática con selects de muchas opciones
+            options_html = "".join(
+                f'<option value="{option.value}" {_SELECTED if option.selected else ""}>'
+                f"{option.label}</option>"
+                for option in field.options
+            )
 
         input_html = f"<select {attrs_str}>{options_html}</select>"
 
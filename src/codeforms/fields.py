@@ -1,7 +1,22 @@
 import re
+import sys
+import weakref
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Set, Union
+from functools import cached_property, lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from uuid import UUID, uuid4
 
 from pydantic import (
@@ -12,9 +27,33 @@ from pydantic import (
     model_validator,
 )
 
+from codeforms import i18n_keys as keys
 from codeforms.i18n import t
 
 
+# Patrones de TextField compilados, compartidos entre instancias con el mismo
+# pattern. Acotado: los patrones pueden venir de formularios cargados desde JSON.
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compila pattern una sola vez; un regex inválido lanza re.error y no se cachea."""
+    return re.compile(pattern)
+
+
+# id(instancia) → cachés derivados de esa instancia. Viven fuera del estado
+# privado de pydantic para no alterar __eq__ y se liberan con la instancia.
+_INSTANCE_CACHES: Dict[int, Dict[str, Any]] = {}
+
+
+def _instance_cache(obj: Any) -> Dict[str, Any]:
+    """Devuelve el dict de caché asociado a obj, creándolo en el primer acceso."""
+    key = id(obj)
+    cache = _INSTANCE_CACHES.get(key)
+    if cache is None:
+        cache = _INSTANCE_CACHES[key] = {}
+        weakref.finalize(obj, _INSTANCE_CACHES.pop, key, None)
+    return cache
+
+
 class FieldType(str, Enum):
     TEXT = "text"
     PASSWORD = "password"
@@ -42,14 +81,24 @@ class ValidationRule(BaseModel):
 class VisibilityRule(BaseModel):
     """Regla de visibilidad condicional para un campo."""
 
+    model_config = {"frozen": True}
+
     field: str  # nombre del campo del que depende
     operator: str = (
         "equals"  # equals, not_equals, in, not_in, gt, lt, is_empty, is_not_empty
     )
     value: Any = None  # valor a comparar
 
+    @field_validator("field", "operator")
+    @classmethod
+    def intern_names(cls, v: str) -> str:
+        """Internar nombres para que las comparaciones sean por identidad."""
+        return sys.intern(v)
+
 
 class SelectOption(BaseModel):
+    model_config = {"frozen": True}
+
     value: str
     label: str
     selected: bool = False
@@ -58,8 +107,19 @@ class SelectOption(BaseModel):
 class DependentOptionsConfig(BaseModel):
     """Configuración para opciones dependientes de otro campo."""
 
+    model_config = {"frozen": True}
+
     depends_on: str  # nombre del campo padre
-    options_map: Dict[str, List[SelectOption]]  # valor_padre → opciones disponibles
+    # valor_padre → opciones disponibles
+    options_map: Dict[str, Tuple[SelectOption, ...]]
+
+    @field_validator("depends_on")
+    @classmethod
+    def intern_depends_on(cls, v: str) -> str:
+        return sys.intern(v)
+
+
+_FieldT = TypeVar("_FieldT", bound="FormFieldBase")
 
 
 class FormFieldBase(BaseModel):
@@ -75,7 +135,7 @@ class FormFieldBase(BaseModel):
     css_classes: Optional[str] = None
     readonly: bool = False
     attributes: Dict[str, str] = Field(default_factory=dict)
-    visible_when: Optional[List[VisibilityRule]] = None
+    visible_when: Optional[Tuple[VisibilityRule, ...]] = None
     dependent_options: Optional[DependentOptionsConfig] = None
 
     @field_validator("attributes", mode="before")
@@ -96,12 +156,27 @@ class FormFieldBase(BaseModel):
         }
     }
 
-    @property
+    @cached_property
     def field_type_value(self) -> str:
         """Return the field_type as a plain string, whether it is a FieldType enum or str."""
         ft = self.field_type
         return ft.value if isinstance(ft, FieldType) else ft
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "field_type":
+            # field_type_value se cachea en __dict__
+            self.__dict__.pop("field_type_value", None)
+
+    def model_copy(
+        self: _FieldT, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> _FieldT:
+        # model_copy copia __dict__ completo, incluido field_type_value
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "field_type" in update:
+            copied.__dict__.pop("field_type_value", None)
+        return copied
+
     def export(self, output_format: str = "html", **kwargs) -> str:
         """Método genérico para exportar el campo en diferentes formatos"""
         from codeforms.export import field_exporter
@@ -118,39 +193,39 @@ class CheckboxField(FormFieldBase):
     @classmethod
     def validate_default_value(cls, v: Any) -> Any:
         if v is not None and not isinstance(v, bool):
-            raise ValueError(t("checkbox.default_must_be_boolean"))
+            raise ValueError(t(keys.CHECKBOX_DEFAULT_MUST_BE_BOOLEAN))
         return v
 
 
 class CheckboxGroupField(FormFieldBase):
     field_type: FieldType = FieldType.CHECKBOX
-    options: List[SelectOption]
+    options: Tuple[SelectOption, ...]
     inline: bool = False
 
     @field_validator("default_value")
     @classmethod
     def validate_default_value(cls, v: Any) -> Any:
         if v is not None and not isinstance(v, list):
-            raise ValueError(t("checkbox_group.default_must_be_list"))
+            raise ValueError(t(keys.CHECKBOX_GROUP_DEFAULT_MUST_BE_LIST))
         return v
 
 
 class RadioField(FormFieldBase):
     field_type: FieldType = FieldType.RADIO
-    options: List[SelectOption]
+    options: Tuple[SelectOption, ...]
     inline: bool = False
 
     @field_validator("default_value")
     @classmethod
     def validate_default_value(cls, v: Any) -> Any:
         if v is not None and not isinstance(v, str):
-            raise ValueError(t("radio.default_must_be_string"))
+            raise ValueError(t(keys.RADIO_DEFAULT_MUST_BE_STRING))
         return v
 
 
 class SelectField(FormFieldBase):
     field_type: FieldType = FieldType.SELECT
-    options: List[SelectOption]
+    options: Tuple[SelectOption, ...]
     multiple: bool = False
     min_selected: Optional[int] = None  # Mínimo de opciones a seleccionar
     max_selected: Optional[int] = None  # Máximo de opciones a seleccionar
@@ -160,9 +235,9 @@ class SelectField(FormFieldBase):
     def validate_min_selected(cls, v: Optional[int], info: Any) -> Optional[int]:
         if v is not None:
             if v < 0:
-                raise ValueError(t("select.min_selected_negative"))
+                raise ValueError(t(keys.SELECT_MIN_SELECTED_NEGATIVE))
             if not info.data.get("multiple", False):
-                raise ValueError(t("select.min_selected_requires_multiple"))
+                raise ValueError(t(keys.SELECT_MIN_SELECTED_REQUIRES_MULTIPLE))
         return v
 
     @field_validator("max_selected")
@@ -170,17 +245,44 @@ class SelectField(FormFieldBase):
     def validate_max_selected(cls, v: Optional[int], info: Any) -> Optional[int]:
         if v is not None:
             if v < 1:
-                raise ValueError(t("select.max_selected_min_value"))
+                raise ValueError(t(keys.SELECT_MAX_SELECTED_MIN_VALUE))
             if not info.data.get("multiple", False):
-                raise ValueError(t("select.max_selected_requires_multiple"))
+                raise ValueError(t(keys.SELECT_MAX_SELECTED_REQUIRES_MULTIPLE))
             min_selected = info.data.get("min_selected")
             if min_selected is not None and v < min_selected:
-                raise ValueError(t("select.max_less_than_min"))
+                raise ValueError(t(keys.SELECT_MAX_LESS_THAN_MIN))
         return v
 
     def get_valid_values(self) -> Set[str]:
         """Retorna un conjunto de valores válidos para este campo"""
-        return {option.value for option in self.options}
+        return set(_option_values(self))
+
+
+def _option_values(field: FormFieldBase) -> FrozenSet[str]:
+    """
+    Valores válidos de un campo con opciones (select, radio, checkbox group).
+    El frozenset se recalcula sólo cuando se reemplaza field.options; una
+    lista asignada directamente (mutable) no se cachea.
+    """
+    options = field.options
+    if type(options) is not tuple:
+        return frozenset(option.value for option in options)
+    caches = _instance_cache(field)
+    cache = caches.get("option_values")
+    if cache is None or cache[0] is not options:
+        cache = caches["option_values"] = (
+            options,
+            frozenset(option.value for option in options),
+        )
+    return cache[1]
+
+
+def _is_valid_option(valid_values: FrozenSet[str], value: Any) -> bool:
+    """value in valid_values; los valores no hashables (listas, dicts) no son opciones."""
+    try:
+        return value in valid_values
+    except TypeError:
+        return False
 
 
 class TextField(FormFieldBase):
@@ -194,27 +296,35 @@ class TextField(FormFieldBase):
     def validate_pattern(cls, v: Optional[str]) -> Optional[str]:
         if v is not None:
             try:
-                re.compile(v)
+                _compile_pattern(v)
             except re.error:
-                raise ValueError(t("text.invalid_regex"))
+                raise ValueError(t(keys.TEXT_INVALID_REGEX))
         return v
 
     def validate_value(self, value: str) -> tuple[bool, Optional[str]]:
+        error = self._check_value(value)
+        if error is None:
+            return True, None
+        key, params = error
+        return False, t(key, **params)
+
+    def _check_value(self, value: str) -> Optional[tuple[str, Dict[str, Any]]]:
+        """Como validate_value, pero devuelve (clave i18n, parámetros) sin traducir."""
         if value is None:
             if self.required:
-                return False, t("field.required")
-            return True, None
+                return keys.FIELD_REQUIRED, {}
+            return None
 
         if self.minlength and len(value) < self.minlength:
-            return False, t("text.minlength", min=self.minlength)
+            return keys.TEXT_MINLENGTH, {"min": self.minlength}
 
         if self.maxlength and len(value) > self.maxlength:
-            return False, t("text.maxlength", max=self.maxlength)
+            return keys.TEXT_MAXLENGTH, {"max": self.maxlength}
 
-        if self.pattern and not re.match(self.pattern, value):
-            return False, t("text.pattern_mismatch")
+        if self.pattern and not _compile_pattern(self.pattern).match(value):
+            return keys.TEXT_PATTERN_MISMATCH, {}
 
-        return True, None
+        return None
 
 
 class EmailField(FormFieldBase):
@@ -265,7 +375,7 @@ class UrlField(FormFieldBase):
         if v is not None and isinstance(v, str):
             # Validación básica de URL
             if not v.startswith(("http://", "https://")):
-                raise ValueError(t("url.invalid_scheme"))
+                raise ValueError(t(keys.URL_INVALID_SCHEME))
         return v
 
 
@@ -310,7 +420,7 @@ class ObjectListField(FormFieldBase):
     def validate_object_fields(self) -> "ObjectListField":
         names = [field.name for field in self.fields]
         if len(names) != len(set(names)):
-            raise ValueError(t("form.unique_field_names_in_group", title=self.label or self.name))
+            raise ValueError(t(keys.FORM_UNIQUE_FIELD_NAMES_IN_GROUP, title=self.label or self.name))
         return self
 
 
@@ -351,7 +461,7 @@ class FieldGroup(BaseModel):
         """Valida que los nombres de campos dentro del grupo sean únicos"""
         names = [field.name for field in self.fields]
         if len(names) != len(set(names)):
-            raise ValueError(t("form.unique_field_names_in_group", title=self.title))
+            raise ValueError(t(keys.FORM_UNIQUE_FIELD_NAMES_IN_GROUP, title=self.title))
         return self
 
     def export(self, output_format: str = "html", **kwargs) -> str:
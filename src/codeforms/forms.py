@@ -1,11 +1,26 @@
 import json
+import os
 import re
-from typing import Any, Type
+from typing import Any, Callable, Type
 
+from pydantic import ConfigDict
+
+from codeforms import _visibility_fast
+from codeforms import i18n_keys as keys
 from codeforms.fields import *
-from codeforms.fields import FieldGroup, FormStep
+from codeforms.fields import (
+    FieldGroup,
+    FormStep,
+    _instance_cache,
+    _is_valid_option,
+    _option_values,
+)
 from codeforms.i18n import t
 
+# Validación básica de email compartida por Form, FormDataValidator y los
+# ítems de ListField
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
 
 class Form(BaseModel):
     id: UUID = Field(default_factory=uuid4)
@@ -63,8 +78,8 @@ class Form(BaseModel):
         return all_fields
 
     @staticmethod
-    def loads(form: Union[str, dict, bytearray]):
-        if isinstance(form, (str, bytearray)):
+    def loads(form: Union[str, bytes, bytearray, dict]):
+        if isinstance(form, (str, bytes, bytearray)):
             return Form.model_validate_json(form)
         else:
             return Form.model_validate(form)
@@ -79,6 +94,8 @@ class Form(BaseModel):
         return cls(name=name, content=fields, **kwargs)
 
     def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
+        # Pasar por JSON garantiza un resultado serializable: model_dump(mode="json")
+        # devolvería inf/NaN tal cual, mientras que el JSON los convierte en null
         return json.loads(self.model_dump_json(exclude_none=exclude_none))
 
     @model_validator(mode="after")
@@ -86,13 +103,16 @@ class Form(BaseModel):
         """Valida que todos los nombres de campos sean únicos en todo el formulario"""
         names = [field.name for field in self.fields]
         if len(names) != len(set(names)):
-            raise ValueError(t("form.unique_field_names"))
+            raise ValueError(t(keys.FORM_UNIQUE_FIELD_NAMES))
         return self
 
     def validate_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Valida todos los campos del formulario y retorna el resultado"""
+        # Los errores se acumulan como (campo, clave i18n, parámetros) y se
+        # traducen una sola vez al construir el resultado.
         errors = []
         validated_data = {}
+        email_match = _EMAIL_RE.match
 
         for field in self.fields:
             field_value = data.get(field.name)
@@ -100,97 +120,80 @@ class Form(BaseModel):
             # Validar campo requerido
             if field.required and field_value is None:
                 errors.append(
-                    {
-                        "field": field.name,
-                        "message": t("field.required_named", name=field.name),
-                    }
+                    (field.name, keys.FIELD_REQUIRED_NAMED, {"name": field.name})
                 )
                 continue
 
             # Validar según el tipo de campo
             if isinstance(field, TextField):
-                is_valid, error_msg = field.validate_value(field_value)
-                if not is_valid:
-                    errors.append({"field": field.name, "message": error_msg})
+                if type(field).validate_value is TextField.validate_value:
+                    # Ruta diferida: la traducción se hace al armar el resultado
+                    error = field._check_value(field_value)
+                    if error is not None:
+                        errors.append((field.name, *error))
+                else:
+                    # Subclase con validate_value propio: respetarlo
+                    is_valid, error_msg = field.validate_value(field_value)
+                    if not is_valid:
+                        errors.append(_make_error(field.name, error_msg))
             elif isinstance(field, EmailField):
-                if not re.match(r"[^@]+@[^@]+\.[^@]+", field_value):
-                    errors.append({"field": field.name, "message": t("email.invalid")})
+                if not email_match(field_value):
+                    errors.append((field.name, keys.EMAIL_INVALID, {}))
             elif isinstance(field, NumberField):
                 try:
                     num_value = float(field_value)
                     if field.min_value is not None and num_value < field.min_value:
                         errors.append(
-                            {
-                                "field": field.name,
-                                "message": t("number.min_value", min=field.min_value),
-                            }
+                            (
+                                field.name,
+                                keys.NUMBER_MIN_VALUE,
+                                {"min": field.min_value},
+                            )
                         )
                     if field.max_value is not None and num_value > field.max_value:
                         errors.append(
-                            {
-                                "field": field.name,
-                                "message": t("number.max_value", max=field.max_value),
-                            }
+                            (
+                                field.name,
+                                keys.NUMBER_MAX_VALUE,
+                                {"max": field.max_value},
+                            )
                         )
                 except (ValueError, TypeError):
-                    errors.append({"field": field.name, "message": t("number.invalid")})
+                    errors.append((field.name, keys.NUMBER_INVALID, {}))
             elif isinstance(field, DateField):
                 try:
                     date_value = date.fromisoformat(field_value)
                     if field.min_date is not None and date_value < field.min_date:
                         errors.append(
-                            {
-                                "field": field.name,
-                                "message": t("date.min_date", min=field.min_date),
-                            }
+                            (field.name, keys.DATE_MIN_DATE, {"min": field.min_date})
                         )
                     if field.max_date is not None and date_value > field.max_date:
                         errors.append(
-                            {
-                                "field": field.name,
-                                "message": t("date.max_date", max=field.max_date),
-                            }
+                            (field.name, keys.DATE_MAX_DATE, {"max": field.max_date})
                         )
                 except (ValueError, TypeError):
-                    errors.append(
-                        {"field": field.name, "message": t("date.invalid_format")}
-                    )
+                    errors.append((field.name, keys.DATE_INVALID_FORMAT, {}))
             elif isinstance(field, SelectField):
-                valid_options = [opt.value for opt in field.options]
+                valid_options = _option_values(field)
                 if field.multiple:
                     if not isinstance(field_value, list) or not all(
-                        v in valid_options for v in field_value
+                        _is_valid_option(valid_options, v) for v in field_value
                     ):
-                        errors.append(
-                            {
-                                "field": field.name,
-                                "message": t("select.invalid_options"),
-                            }
-                        )
-                elif field_value not in valid_options:
-                    errors.append(
-                        {"field": field.name, "message": t("select.invalid_option")}
-                    )
+                        errors.append((field.name, keys.SELECT_INVALID_OPTIONS, {}))
+                elif not _is_valid_option(valid_options, field_value):
+                    errors.append((field.name, keys.SELECT_INVALID_OPTION, {}))
             elif isinstance(field, RadioField):
-                if field_value not in [opt.value for opt in field.options]:
-                    errors.append(
-                        {"field": field.name, "message": t("radio.invalid_option")}
-                    )
+                if not _is_valid_option(_option_values(field), field_value):
+                    errors.append((field.name, keys.RADIO_INVALID_OPTION, {}))
             elif isinstance(field, CheckboxField):
                 if not isinstance(field_value, bool):
-                    errors.append(
-                        {"field": field.name, "message": t("checkbox.must_be_boolean")}
-                    )
+                    errors.append((field.name, keys.CHECKBOX_MUST_BE_BOOLEAN, {}))
             elif isinstance(field, CheckboxGroupField):
+                valid_options = _option_values(field)
                 if not isinstance(field_value, list) or not all(
-                    v in [opt.value for opt in field.options] for v in field_value
+                    _is_valid_option(valid_options, v) for v in field_value
                 ):
-                    errors.append(
-                        {
-                            "field": field.name,
-                            "message": t("checkbox_group.invalid_options"),
-                        }
-                    )
+                    errors.append((field.name, keys.CHECKBOX_GROUP_INVALID_OPTIONS, {}))
             elif isinstance(field, ListField):
                 value, field_errors = _validate_list_field_value(field, field_value)
                 if field_errors:
@@ -209,13 +212,14 @@ class Form(BaseModel):
             if not errors and field.name not in validated_data:
                 validated_data[field.name] = field_value
 
+        success = not errors
         return {
-            "success": len(errors) == 0,
-            "data": validated_data if not errors else None,
-            "errors": errors,
-            "message": t("form.validation_success")
-            if not errors
-            else t("form.validation_error"),
+            "success": success,
+            "data": validated_data if success else None,
+            "errors": _translate_errors(errors) if errors else [],
+            "message": t(
+                keys.FORM_VALIDATION_SUCCESS if success else keys.FORM_VALIDATION_ERROR
+            ),
         }
 
     def export(self, output_format: str = "html", **kwargs) -> dict:
@@ -256,6 +260,25 @@ class Form(BaseModel):
         """Retorna solo los campos visibles según las reglas visible_when."""
         return [f for f in self.fields if evaluate_visibility(f, data)]
 
+    def to_js_visibility(self) -> Dict[str, str]:
+        """Genera predicados JavaScript equivalentes a las reglas visible_when.
+
+        Permite que el navegador evalúe la visibilidad sin consultar al
+        servidor. Solo incluye los campos que tienen reglas.
+
+        Returns:
+            Dict nombre_de_campo → código fuente de ``function(d){...}``.
+
+        Raises:
+            ValueError: Si una regla usa un valor sin equivalente fiel en
+                JavaScript (fechas, dicts, listas anidadas).
+        """
+        return {
+            field.name: _js_visibility_function(field.visible_when)
+            for field in self.fields
+            if field.visible_when is not None
+        }
+
     def validate_step(
         self, step_index: int, data: Dict[str, Any], respect_visibility: bool = True
     ) -> Dict[str, Any]:
@@ -274,14 +297,12 @@ class Form(BaseModel):
         """
         steps = self.get_steps()
         if not steps:
-            raise ValueError(t("wizard.not_a_wizard_form"))
+            raise ValueError(t(keys.WIZARD_NOT_A_WIZARD_FORM))
         if not (0 <= step_index < len(steps)):
             raise ValueError(
-                t("wizard.invalid_step_index", index=step_index, max=len(steps) - 1)
+                t(keys.WIZARD_INVALID_STEP_INDEX, index=step_index, max=len(steps) - 1)
             )
-        return validate_form_data_dynamic(
-            self, data, respect_visibility=respect_visibility, current_step=step_index
-        )
+        return _validate_fields(steps[step_index].fields, data, respect_visibility)
 
     def validate_all_steps(
         self, data: Dict[str, Any], respect_visibility: bool = True
@@ -299,13 +320,20 @@ class Form(BaseModel):
         step_errors = {}
         all_validated_data = {}
 
-        for idx in range(len(steps)):
-            result = self.validate_step(idx, data, respect_visibility)
-            if not result["success"]:
-                step_errors[idx] = result.get("errors", [])
-                all_errors.extend(result.get("errors", []))
-            elif result.get("data"):
-                all_validated_data.update(result["data"])
+        # Se recorre cada paso una sola vez acumulando directamente en los
+        # totales, sin construir ni traducir un resultado intermedio por paso
+        for idx, step in enumerate(steps):
+            try:
+                step_data, errors = _collect_field_results(
+                    step.fields, data, respect_visibility
+                )
+            except Exception as e:
+                step_data, errors = None, [{"field": "unknown", "message": str(e)}]
+            if errors:
+                step_errors[idx] = errors
+                all_errors.extend(errors)
+            else:
+                all_validated_data.update(step_data)
 
         success = len(all_errors) == 0
         return {
@@ -313,9 +341,9 @@ class Form(BaseModel):
             "data": all_validated_data if success else None,
             "errors": all_errors if all_errors else [],
             "step_errors": step_errors if step_errors else None,
-            "message": t("form.validation_success")
+            "message": t(keys.FORM_VALIDATION_SUCCESS)
             if success
-            else t("wizard.validation_failed"),
+            else t(keys.WIZARD_VALIDATION_FAILED),
         }
 
 
@@ -359,14 +387,59 @@ class FormDataModel(BaseModel):
         super().__init__()
 
 
+def _data_model_key(form: Form, fields: List[FormFieldBase]) -> tuple:
+    """Firma de todo lo que create_model lee de los campos del formulario."""
+    return (
+        form.name,
+        tuple(
+            (
+                type(field),
+                field.name,
+                field.required,
+                field.help_text,
+                tuple(opt.value for opt in getattr(field, "options", ())),
+                getattr(field, "multiple", None),
+                getattr(field, "min_selected", None),
+                getattr(field, "max_selected", None),
+            )
+            for field in fields
+        ),
+    )
+
+
+# Modelos generados por FormDataValidator.create_model, indexados por
+# _data_model_key. Se guardan fuera del Form para no alterar su __eq__;
+# al superar el límite se descarta el más antiguo.
+_DATA_MODELS: Dict[tuple, Type[BaseModel]] = {}
+_DATA_MODELS_MAX = 256
+
+
 class FormDataValidator:
     @staticmethod
     def create_model(form: Form) -> Type[BaseModel]:
+        """Genera (o reutiliza) el modelo Pydantic para los datos del formulario.
+
+        El modelo se reutiliza mientras no cambien los campos de los que
+        depende (ver _data_model_key).
+        """
+        # form.fields aplana el contenido en cada acceso: se calcula una vez
+        fields = form.fields
+        key = _data_model_key(form, fields)
+        model = _DATA_MODELS.get(key)
+        if model is None:
+            model = FormDataValidator._build_model(form, fields)
+            if len(_DATA_MODELS) >= _DATA_MODELS_MAX:
+                del _DATA_MODELS[next(iter(_DATA_MODELS))]
+            _DATA_MODELS[key] = model
+        return model
+
+    @staticmethod
+    def _build_model(form: Form, form_fields: List[FormFieldBase]) -> Type[BaseModel]:
         fields = {}
         annotations = {}
         validations = {}
 
-        for field in form.fields:
+        for field in form_fields:
             # Configurar el tipo y las validaciones según el tipo de campo
             if isinstance(field, SelectField):
                 valid_values = field.get_valid_values()
@@ -378,17 +451,18 @@ class FormDataValidator:
                         valid_values=valid_values,
                         min_selected=field.min_selected,
                         max_selected=field.max_selected,
+                        required=field.required,
                     ):
                         def validate_select_values(v: List[str]) -> List[str]:
-                            if not v and field.required:
-                                raise ValueError(t("field.required"))
+                            if not v and required:
+                                raise ValueError(t(keys.FIELD_REQUIRED))
 
                             # Validar que todos los valores sean válidos
                             invalid_values = set(v) - valid_values
                             if invalid_values:
                                 raise ValueError(
                                     t(
-                                        "select.invalid_values",
+                                        keys.SELECT_INVALID_VALUES,
                                         values=", ".join(invalid_values),
                                     )
                                 )
@@ -396,13 +470,13 @@ class FormDataValidator:
                             # Validar cantidad mínima de selecciones
                             if min_selected is not None and len(v) < min_selected:
                                 raise ValueError(
-                                    t("select.min_selected", min=min_selected)
+                                    t(keys.SELECT_MIN_SELECTED, min=min_selected)
                                 )
 
                             # Validar cantidad máxima de selecciones
                             if max_selected is not None and len(v) > max_selected:
                                 raise ValueError(
-                                    t("select.max_selected", max=max_selected)
+                                    t(keys.SELECT_MAX_SELECTED, max=max_selected)
                                 )
 
                             return v
@@ -416,14 +490,16 @@ class FormDataValidator:
                     field_type = str
 
                     # Crear validador para valor único
-                    def create_validator(valid_values=valid_values):
+                    def create_validator(
+                        valid_values=valid_values, required=field.required
+                    ):
                         def validate_select_value(v: str) -> str:
-                            if not v and field.required:
-                                raise ValueError(t("field.required"))
+                            if not v and required:
+                                raise ValueError(t(keys.FIELD_REQUIRED))
                             if v not in valid_values:
                                 raise ValueError(
                                     t(
-                                        "select.invalid_value_must_be_one_of",
+                                        keys.SELECT_INVALID_VALUE_MUST_BE_ONE_OF,
                                         valid=", ".join(valid_values),
                                     )
                                 )
@@ -486,28 +562,42 @@ def _make_error(field_name: str, message: str) -> dict:
     return {"field": field_name, "message": message}
 
 
+def _translate_errors(errors: List[Any]) -> List[dict]:
+    """Materializa errores diferidos (campo, clave, parámetros) como dicts.
+
+    Los errores que ya vienen como dict (listas y listas de objetos) se
+    devuelven tal cual.
+    """
+    return [
+        error
+        if isinstance(error, dict)
+        else _make_error(error[0], t(error[1], **error[2]))
+        for error in errors
+    ]
+
+
 def _validate_primitive_list_item(item_type: str, value: Any) -> tuple[Any, Optional[str]]:
     if item_type == "number":
         try:
             return float(value), None
         except (TypeError, ValueError):
-            return None, t("number.invalid")
+            return None, t(keys.NUMBER_INVALID)
 
     if item_type == "email":
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", str(value)):
-            return None, t("email.invalid")
+        if not _EMAIL_RE.match(str(value)):
+            return None, t(keys.EMAIL_INVALID)
         return str(value), None
 
     if item_type == "url":
         if not isinstance(value, str) or not value.startswith(("http://", "https://")):
-            return None, t("url.invalid_scheme")
+            return None, t(keys.URL_INVALID_SCHEME)
         return value, None
 
     if item_type == "date":
         try:
             return date.fromisoformat(str(value)).isoformat(), None
         except (TypeError, ValueError):
-            return None, t("date.invalid_format")
+            return None, t(keys.DATE_INVALID_FORMAT)
 
     if not isinstance(value, str):
         value = str(value)
@@ -520,7 +610,7 @@ def _validate_list_field_value(field: ListField, field_value: Any, field_path: O
         field_value = [field_value]
 
     if not isinstance(field_value, list):
-        return None, [_make_error(field_name, t("select.value_must_be_list"))]
+        return None, [_make_error(field_name, t(keys.SELECT_VALUE_MUST_BE_LIST))]
 
     if field.min_items is not None and len(field_value) < field.min_items:
         return None, [_make_error(field_name, f"Expected at least {field.min_items} items")]
@@ -543,7 +633,7 @@ def _validate_list_field_value(field: ListField, field_value: Any, field_path: O
 def _validate_object_list_field_value(field: ObjectListField, field_value: Any, field_path: Optional[str] = None) -> tuple[Any, List[dict]]:
     field_name = field_path or field.name
     if not isinstance(field_value, list):
-        return None, [_make_error(field_name, t("select.value_must_be_list"))]
+        return None, [_make_error(field_name, t(keys.SELECT_VALUE_MUST_BE_LIST))]
 
     if field.min_items is not None and len(field_value) < field.min_items:
         return None, [_make_error(field_name, f"Expected at least {field.min_items} items")]
@@ -551,7 +641,7 @@ def _validate_object_list_field_value(field: ObjectListField, field_value: Any,
     if field.max_items is not None and len(field_value) > field.max_items:
         return None, [_make_error(field_name, f"Expected at most {field.max_items} items")]
 
-    allowed_fields = {subfield.name for subfield in field.fields}
+    allowed_fields = frozenset(subfield.name for subfield in field.fields)
     validated_items = []
     errors = []
 
@@ -561,8 +651,8 @@ def _validate_object_list_field_value(field: ObjectListField, field_value: Any,
             errors.append(_make_error(item_path, "Each item must be an object"))
             continue
 
-        extra_fields = sorted(set(item.keys()) - allowed_fields)
-        if extra_fields:
+        if not item.keys() <= allowed_fields:
+            extra_fields = sorted(item.keys() - allowed_fields)
             errors.append(_make_error(item_path, f"Unknown fields: {', '.join(extra_fields)}"))
 
         validated_item = {}
@@ -598,7 +688,7 @@ def validate_form_data(form: Form, data: Dict[str, Any]) -> Dict[str, Any]:
                 return {
                     "success": False,
                     "errors": errors,
-                    "message": t("form.data_validation_error"),
+                    "message": t(keys.FORM_DATA_VALIDATION_ERROR),
                 }
             if value is not None:
                 validated_data[field.name] = value
@@ -606,23 +696,207 @@ def validate_form_data(form: Form, data: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "success": True,
             "data": validated_data,
-            "message": t("form.validation_success"),
+            "message": t(keys.FORM_VALIDATION_SUCCESS),
         }
 
     except Exception as e:
         return {
             "success": False,
             "errors": [{"field": "unknown", "message": str(e)}],
-            "message": t("form.data_validation_error"),
+            "message": t(keys.FORM_DATA_VALIDATION_ERROR),
         }
 
 
+# CODEFORMS_NO_CODEGEN=1 desactiva la compilación de reglas visible_when y
+# fuerza la evaluación interpretada.
+_VISIBILITY_CODEGEN = os.environ.get("CODEFORMS_NO_CODEGEN") != "1"
+
+# Plantillas de expresión por operador. {k} y {v} son nombres de constantes
+# del namespace generado; los valores nunca se incrustan en el código fuente.
+_VISIBILITY_EXPR = {
+    "equals": "g({k}) == {v}",
+    "not_equals": "g({k}) != {v}",
+    "in": "_in(g({k}), {v})",
+    "not_in": "_not_in(g({k}), {v})",
+    "gt": "((x := g({k})) is not None and x > {v})",
+    "lt": "((x := g({k})) is not None and x < {v})",
+    "is_empty": "((x := g({k})) is None or x == '' or x == [])",
+    "is_not_empty": "((x := g({k})) is not None and x != '' and x != [])",
+}
+
+
+def _compile_visibility_predicate(
+    rules: Tuple[VisibilityRule, ...],
+) -> Callable[[Dict[str, Any]], bool]:
+    """Compila un conjunto de reglas visible_when a una única función Python.
+
+    Genera algo como ``def _p(d): g = d.get; return g(_k0) == _v0 and ...``.
+    Los operadores desconocidos se ignoran, igual que en la ruta interpretada.
+    """
+    namespace: Dict[str, Any] = {
+        "_in": _visibility_fast.op_in,
+        "_not_in": _visibility_fast.op_not_in,
+    }
+    terms = []
+    for i, rule in enumerate(rules):
+        template = _VISIBILITY_EXPR.get(rule.operator)
+        if template is None:
+            continue
+        value = rule.value
+        if rule.operator in ("in", "not_in"):
+            value = _visibility_fast.freeze_members(value)
+        namespace[f"_k{i}"] = rule.field
+        namespace[f"_v{i}"] = value
+        terms.append("(" + template.format(k=f"_k{i}", v=f"_v{i}") + ")")
+
+    body = " and ".join(terms) if terms else "True"
+    source = f"def _p(d):\n    g = d.get\n    return {body}\n"
+    exec(compile(source, "<codeforms-visibility>", "exec"), namespace)
+    return namespace["_p"]
+
+
+def _interpret_visibility_predicate(
+    rules: Tuple[VisibilityRule, ...],
+) -> Callable[[Dict[str, Any]], bool]:
+    """Ruta interpretada (CODEFORMS_NO_CODEGEN=1).
+
+    Las reglas se reducen una vez a tuplas (campo, código de operador, valor)
+    que evalúa ``codeforms._visibility_fast`` (compilable con mypyc).
+    """
+    op_codes = _visibility_fast.OP_CODES
+    rule_tuples = tuple(
+        (
+            rule.field,
+            op_codes[rule.operator],
+            _visibility_fast.freeze_members(rule.value)
+            if rule.operator in ("in", "not_in")
+            else rule.value,
+        )
+        for rule in rules
+        if rule.operator in op_codes
+    )
+    evaluate = _visibility_fast.evaluate
+    return lambda data: evaluate(rule_tuples, data)
+
+
+# Expresiones JavaScript por operador. {x} es el valor del campo leído con
+# _JS_GETTER y {v} el literal JSON.
+_JS_VISIBILITY_EXPR = {
+    "equals": "{x} === {v}",
+    "not_equals": "{x} !== {v}",
+    "in": "{v}.includes({x})",
+    "not_in": "!{v}.includes({x})",
+    "gt": "({x} !== null && {x} > {v})",
+    "lt": "({x} !== null && {x} < {v})",
+    "is_empty": "({x} === null || {x} === '' || (Array.isArray({x}) && {x}.length === 0))",
+    "is_not_empty": "!({x} === null || {x} === '' || (Array.isArray({x}) && {x}.length === 0))",
+}
+
+# Variantes para operandos que en JavaScript no se comparan igual que en
+# Python: listas (== estructural en Python, === por referencia en JS) y
+# cadenas como destino de in/not_in (pertenencia de subcadena en Python).
+_JS_VISIBILITY_LIST_EXPR = {
+    "equals": "JSON.stringify({x}, _b) === JSON.stringify({v})",
+    "not_equals": "JSON.stringify({x}, _b) !== JSON.stringify({v})",
+}
+
+# Lectura del valor como data.get en Python: solo claves propias (d["constructor"]
+# no debe devolver el heredado de Object.prototype) y ausente/undefined → null.
+# Los booleanos se pasan a número porque en Python True == 1 y False == 0;
+# _b hace lo mismo dentro de listas al compararlas con JSON.stringify.
+_JS_GETTER = (
+    "const _b=(k,v)=>typeof v==='boolean'?+v:v;"
+    "const g=(k)=>_b(k,Object.prototype.hasOwnProperty.call(d,k)?d[k]??null:null);"
+)
+_JS_VISIBILITY_SUBSTRING_EXPR = {
+    "in": "(typeof {x} === 'string' && {v}.includes({x}))",
+    "not_in": "!(typeof {x} === 'string' && {v}.includes({x}))",
+}
+
+# Valores que tienen un equivalente JSON exacto en JavaScript
+_JS_SCALARS = (str, int, float, bool, type(None))
+_JS_UNSUPPORTED = object()
+
+
+def _js_literal(value: Any) -> str:
+    """Literal JSON seguro para incrustar dentro de <script>."""
+    return (
+        json.dumps(value)
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+    )
+
+
+def _js_visibility_term(rule: VisibilityRule, template: str) -> str:
+    """Traduce una regla a una expresión JavaScript con la misma semántica que en Python.
+
+    Raises:
+        ValueError: Si el valor de la regla no tiene una traducción fiel
+            (p. ej. fechas, dicts o listas anidadas).
+    """
+    operator = rule.operator
+    value = rule.value
+    if operator in ("in", "not_in"):
+        if not value:
+            value = []  # Python: un destino vacío nunca contiene al valor
+        if isinstance(value, str):
+            template = _JS_VISIBILITY_SUBSTRING_EXPR[operator]
+        elif isinstance(value, (list, tuple, set, frozenset)) and all(
+            isinstance(member, _JS_SCALARS) for member in value
+        ):
+            value = list(value)
+        else:
+            value = _JS_UNSUPPORTED
+    elif operator in ("equals", "not_equals"):
+        if type(value) is list and all(
+            isinstance(member, _JS_SCALARS) for member in value
+        ):
+            template = _JS_VISIBILITY_LIST_EXPR[operator]
+        elif not isinstance(value, _JS_SCALARS):
+            value = _JS_UNSUPPORTED
+    elif operator in ("gt", "lt"):
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            value = _JS_UNSUPPORTED
+    if value is _JS_UNSUPPORTED:
+        raise ValueError(
+            f"visible_when rule on {rule.field!r}: operator {operator!r} with "
+            f"value {rule.value!r} cannot be translated to JavaScript"
+        )
+    x = f"g({_js_literal(rule.field)})"
+    return template.format(x=x, v=_js_literal(_js_bools_as_numbers(value)))
+
+
+def _js_bools_as_numbers(value: Any) -> Any:
+    """True/False → 1/0 (también dentro de listas), como los compara Python."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, list):
+        return [int(m) if isinstance(m, bool) else m for m in value]
+    return value
+
+
+def _js_visibility_function(rules: Tuple[VisibilityRule, ...]) -> str:
+    terms = []
+    for rule in rules:
+        template = _JS_VISIBILITY_EXPR.get(rule.operator)
+        if template is None:
+            continue
+        terms.append(_js_visibility_term(rule, template))
+    if not terms:
+        return "function(d){return true;}"
+    return f"function(d){{{_JS_GETTER}return {' && '.join(terms)};}}"
+
+
 def evaluate_visibility(field: FormFieldBase, data: Dict[str, Any]) -> bool:
     """Evalúa si un campo es visible basado en sus reglas visible_when.
 
     Sin reglas (visible_when=None) → siempre visible.
     Múltiples reglas → AND lógico (todas deben cumplirse).
 
+    Las reglas se compilan una sola vez por campo y el predicado resultante
+    se reutiliza mientras ``visible_when`` no sea reemplazado.
+
     Args:
         field: Campo con posibles reglas visible_when.
         data: Datos del formulario para evaluar condiciones.
@@ -630,38 +904,21 @@ def evaluate_visibility(field: FormFieldBase, data: Dict[str, Any]) -> bool:
     Returns:
         True si el campo es visible, False si está oculto.
     """
-    if field.visible_when is None:
+    rules = field.visible_when
+    if rules is None:
         return True
 
-    for rule in field.visible_when:
-        field_value = data.get(rule.field)
-
-        if rule.operator == "equals":
-            if field_value != rule.value:
-                return False
-        elif rule.operator == "not_equals":
-            if field_value == rule.value:
-                return False
-        elif rule.operator == "in":
-            if field_value not in (rule.value or []):
-                return False
-        elif rule.operator == "not_in":
-            if field_value in (rule.value or []):
-                return False
-        elif rule.operator == "gt":
-            if not (field_value is not None and field_value > rule.value):
-                return False
-        elif rule.operator == "lt":
-            if not (field_value is not None and field_value < rule.value):
-                return False
-        elif rule.operator == "is_empty":
-            if field_value is not None and field_value != "" and field_value != []:
-                return False
-        elif rule.operator == "is_not_empty":
-            if field_value is None or field_value == "" or field_value == []:
-                return False
-
-    return True
+    build = (
+        _compile_visibility_predicate
+        if _VISIBILITY_CODEGEN
+        else _interpret_visibility_predicate
+    )
+    # (visible_when, constructor, predicado), fuera del estado de pydantic
+    caches = _instance_cache(field)
+    cache = caches.get("visibility")
+    if cache is None or cache[0] is not rules or cache[1] is not build:
+        cache = caches["visibility"] = (rules, build, build(rules))
+    return cache[2](data)
 
 
 def _validate_field_value(
@@ -680,28 +937,28 @@ def _validate_field_value(
 
     # Validar campo requerido
     if field.required and field_value is None:
-        return None, [_make_error(field_name, t("field.required_named", name=field.name))]
+        return None, [_make_error(field_name, t(keys.FIELD_REQUIRED_NAMED, name=field.name))]
 
     if field_value is None:
         return field_value, []
 
     # Select validation
     if field.field_type == FieldType.SELECT:
-        valid_options = [opt.value for opt in field.options]
+        valid_options = _option_values(field)
         if field.multiple:
             if isinstance(field_value, str):
                 field_value = [field_value]
             if not isinstance(field_value, list):
-                return None, [_make_error(field_name, t("select.value_must_be_list"))]
-            invalid_values = [v for v in field_value if v not in valid_options]
+                return None, [_make_error(field_name, t(keys.SELECT_VALUE_MUST_BE_LIST))]
+            invalid_values = [v for v in field_value if not _is_valid_option(valid_options, v)]
             if invalid_values:
-                return None, [_make_error(field_name, t("select.invalid_values", values=str(invalid_values)))]
+                return None, [_make_error(field_name, t(keys.SELECT_INVALID_VALUES, values=str(invalid_values)))]
         else:
-            if field_value not in valid_options:
+            if not _is_valid_option(valid_options, field_value):
                 return None, [_make_error(field_name, t(
-                        "select.invalid_option_value",
+                        keys.SELECT_INVALID_OPTION_VALUE,
                         value=field_value,
-                        valid=str(valid_options),
+                        valid=str([opt.value for opt in field.options]),
                     ))]
         return field_value, []
 
@@ -715,20 +972,20 @@ def _validate_field_value(
 
     # Email validation
     if field.field_type == FieldType.EMAIL:
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", str(field_value)):
-            return None, [_make_error(field_name, t("email.invalid"))]
+        if not _EMAIL_RE.match(str(field_value)):
+            return None, [_make_error(field_name, t(keys.EMAIL_INVALID))]
         return field_value, []
 
     # Checkbox group validation
     if field.field_type == FieldType.CHECKBOX and hasattr(field, "options"):
-        valid_options = [opt.value for opt in field.options]
+        valid_options = _option_values(field)
         if isinstance(field_value, str):
             field_value = [field_value]
         if not isinstance(field_value, list):
-            return None, [_make_error(field_name, t("select.value_must_be_list"))]
-        invalid_values = [v for v in field_value if v not in valid_options]
+            return None, [_make_error(field_name, t(keys.SELECT_VALUE_MUST_BE_LIST))]
+        invalid_values = [v for v in field_value if not _is_valid_option(valid_options, v)]
         if invalid_values:
-            return None, [_make_error(field_name, t("select.invalid_values", values=str(invalid_values)))]
+            return None, [_make_error(field_name, t(keys.SELECT_INVALID_VALUES, values=str(invalid_values)))]
         return field_value, []
 
     # Single checkbox validation
@@ -737,9 +994,8 @@ def _validate_field_value(
 
     # Radio validation
     if field.field_type == FieldType.RADIO:
-        valid_options = [opt.value for opt in field.options]
-        if field_value not in valid_options:
-            return None, [_make_error(field_name, t("radio.invalid_option"))]
+        if not _is_valid_option(_option_values(field), field_value):
+            return None, [_make_error(field_name, t(keys.RADIO_INVALID_OPTION))]
         return field_value, []
 
     # Number validation
@@ -748,13 +1004,13 @@ def _validate_field_value(
             num_value = float(field_value)
             if hasattr(field, "min_value") and field.min_value is not None:
                 if num_value < field.min_value:
-                    return None, [_make_error(field_name, t("number.min_value", min=field.min_value))]
+                    return None, [_make_error(field_name, t(keys.NUMBER_MIN_VALUE, min=field.min_value))]
             if hasattr(field, "max_value") and field.max_value is not None:
                 if num_value > field.max_value:
-                    return None, [_make_error(field_name, t("number.max_value", max=field.max_value))]
+                    return None, [_make_error(field_name, t(keys.NUMBER_MAX_VALUE, max=field.max_value))]
             return num_value, None
         except (ValueError, TypeError):
-            return None, [_make_error(field_name, t("number.invalid"))]
+            return None, [_make_error(field_name, t(keys.NUMBER_INVALID))]
 
     # Text validation
     if field.field_type == FieldType.TEXT:
@@ -762,10 +1018,10 @@ def _validate_field_value(
             field_value = str(field_value)
         if hasattr(field, "minlength") and field.minlength is not None:
             if len(field_value) < field.minlength:
-                return None, [_make_error(field_name, t("text.minlength", min=field.minlength))]
+                return None, [_make_error(field_name, t(keys.TEXT_MINLENGTH, min=field.minlength))]
         if hasattr(field, "maxlength") and field.maxlength is not None:
             if len(field_value) > field.maxlength:
-                return None, [_make_error(field_name, t("text.maxlength", max=field.maxlength))]
+                return None, [_make_error(field_name, t(keys.TEXT_MAXLENGTH, max=field.maxlength))]
         return field_value, []
 
     # Default: pasar el valor sin validación adicional
@@ -795,59 +1051,79 @@ def validate_form_data_dynamic(
     Returns:
         Dict con success, data, errors, message.
     """
-    try:
-        validated_data = {}
-        errors = []
-
-        # Determinar qué campos validar
-        if current_step is not None:
-            steps = form.get_steps()
-            if 0 <= current_step < len(steps):
-                fields_to_validate = steps[current_step].fields
-            else:
-                return {
-                    "success": False,
-                    "errors": [
-                        {
-                            "field": "unknown",
-                            "message": t(
-                                "wizard.invalid_step_index",
-                                index=current_step,
-                                max=len(steps) - 1,
-                            ),
-                        }
-                    ],
-                    "message": t("form.data_validation_error"),
-                }
-        else:
-            fields_to_validate = form.fields
+    # Determinar qué campos validar
+    if current_step is not None:
+        steps = form.get_steps()
+        if not 0 <= current_step < len(steps):
+            return {
+                "success": False,
+                "errors": [
+                    {
+                        "field": "unknown",
+                        "message": t(
+                            keys.WIZARD_INVALID_STEP_INDEX,
+                            index=current_step,
+                            max=len(steps) - 1,
+                        ),
+                    }
+                ],
+                "message": t(keys.FORM_DATA_VALIDATION_ERROR),
+            }
+        fields_to_validate = steps[current_step].fields
+    else:
+        fields_to_validate = form.fields
 
-        for field in fields_to_validate:
-            # Evaluar visibilidad
-            if respect_visibility and not evaluate_visibility(field, data):
-                continue  # Campo oculto, no validar
+    return _validate_fields(fields_to_validate, data, respect_visibility)
 
-            field_value = data.get(field.name)
-            value, field_errors = _validate_field_value(field, field_value, data)
 
-            if field_errors:
-                errors.extend(field_errors)
-            elif value is not None:
-                validated_data[field.name] = value
+def _validate_fields(
+    fields: List[FormFieldBase], data: Dict[str, Any], respect_visibility: bool
+) -> Dict[str, Any]:
+    """Núcleo de validate_form_data_dynamic sobre una lista de campos ya elegida.
 
+    Form.validate_step y validate_all_steps lo llaman directamente con los
+    campos de cada paso, sin volver a recorrer el contenido del formulario.
+    """
+    try:
+        validated_data, errors = _collect_field_results(
+            fields, data, respect_visibility
+        )
         success = len(errors) == 0
         return {
             "success": success,
             "data": validated_data if success else None,
             "errors": errors if errors else [],
-            "message": t("form.validation_success")
+            "message": t(keys.FORM_VALIDATION_SUCCESS)
             if success
-            else t("form.data_validation_error"),
+            else t(keys.FORM_DATA_VALIDATION_ERROR),
         }
 
     except Exception as e:
         return {
             "success": False,
             "errors": [{"field": "unknown", "message": str(e)}],
-            "message": t("form.data_validation_error"),
+            "message": t(keys.FORM_DATA_VALIDATION_ERROR),
         }
+
+
+def _collect_field_results(
+    fields: List[FormFieldBase], data: Dict[str, Any], respect_visibility: bool
+) -> Tuple[Dict[str, Any], List[dict]]:
+    """Valida cada campo y retorna (datos validados, errores) sin armar el resultado."""
+    validated_data = {}
+    errors = []
+
+    for field in fields:
+        # Evaluar visibilidad
+        if respect_visibility and not evaluate_visibility(field, data):
+            continue  # Campo oculto, no validar
+
+        field_value = data.get(field.name)
+        value, field_errors = _validate_field_value(field, field_value, data)
+
+        if field_errors:
+            errors.extend(field_errors)
+        elif value is not None:
+            validated_data[field.name] = value
+
+    return validated_data, errors
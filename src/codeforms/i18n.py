@@ -5,11 +5,15 @@ Provides a configurable message system with locale-based message loading.
 Default locale is English ('en'). Spanish ('es') is also included.
 
 Usage:
-    from codeforms.i18n import set_locale, get_locale, t, register_locale
+    from codeforms.i18n import set_locale, get_locale, use_locale, t, register_locale
 
-    # Change locale globally
+    # Change locale (process-wide)
     set_locale('es')
 
+    # Temporarily override it for the current thread / asyncio task
+    with use_locale('en'):
+        ...
+
     # Get a translated message
     msg = t('field.required')  # "Este campo es requerido"
 
@@ -25,146 +29,123 @@ Usage:
 
 from __future__ import annotations
 
-import copy
-from typing import Any, Dict, Optional
-
-# --- Message catalogs per locale ---
-
-_MESSAGES_EN: Dict[str, str] = {
-    # Field-level validation
-    "field.required": "This field is required",
-    "field.required_named": "The field {name} is required",
-    # TextField
-    "text.minlength": "Minimum length is {min}",
-    "text.maxlength": "Maximum length is {max}",
-    "text.pattern_mismatch": "Value does not match the required pattern",
-    "text.invalid_regex": "Invalid regex pattern",
-    # EmailField
-    "email.invalid": "Invalid email",
-    # NumberField
-    "number.min_value": "Value must be greater than or equal to {min}",
-    "number.max_value": "Value must be less than or equal to {max}",
-    "number.invalid": "Must be a valid number",
-    # DateField
-    "date.min_date": "Date must be after {min}",
-    "date.max_date": "Date must be before {max}",
-    "date.invalid_format": "Must be a valid date in YYYY-MM-DD format",
-    # SelectField
-    "select.invalid_option": "Invalid option selected",
-    "select.invalid_options": "Invalid options selected",
-    "select.invalid_option_value": "Invalid option: {value}. Must be one of: {valid}",
-    "select.invalid_values": "Invalid values: {values}",
-    "select.min_selected": "Must select at least {min} options",
-    "select.max_selected": "Can select at most {max} options",
-    "select.value_must_be_list": "Value must be a list",
-    "select.min_selected_negative": "min_selected cannot be negative",
-    "select.min_selected_requires_multiple": "min_selected can only be used with multiple=True",
-    "select.max_selected_min_value": "max_selected must be greater than 0",
-    "select.max_selected_requires_multiple": "max_selected can only be used with multiple=True",
-    "select.max_less_than_min": "max_selected must be greater than or equal to min_selected",
-    "select.invalid_value_must_be_one_of": "Invalid value. Must be one of: {valid}",
-    # RadioField
-    "radio.invalid_option": "Invalid option selected",
-    "radio.default_must_be_string": "Default value must be a string",
-    # CheckboxField
-    "checkbox.must_be_boolean": "Must be a boolean value",
-    "checkbox.default_must_be_boolean": "Default value must be a boolean",
-    # CheckboxGroupField
-    "checkbox_group.default_must_be_list": "Default value must be a list of values",
-    "checkbox_group.invalid_options": "Invalid options selected",
-    # UrlField
-    "url.invalid_scheme": "URL must start with http:// or https://",
-    # Form-level
-    "form.unique_field_names": "Field names must be unique in the form",
-    "form.unique_field_names_in_group": "Field names must be unique within group '{title}'",
-    "form.validation_success": "Data validated successfully",
-    "form.validation_error": "Validation error",
-    "form.data_validation_error": "Data validation error",
-    # Export / HTML
-    "export.fix_errors": "Please fix the following errors:",
-    "export.submit": "Submit",
-    "export.field_required": "The field {label} is required",
-    # Wizard / Multi-step
-    "wizard.not_a_wizard_form": "This form is not configured as a wizard (no steps found)",
-    "wizard.invalid_step_index": "Invalid step index {index}, must be between 0 and {max}",
-    "wizard.step_validation_failed": "Validation failed for step {step}",
-    "wizard.validation_failed": "Wizard validation failed",
-    # Visibility
-    "visibility.unknown_operator": "Unknown visibility operator: {operator}",
-}
-
-_MESSAGES_ES: Dict[str, str] = {
-    # Validación a nivel de campo
-    "field.required": "Este campo es requerido",
-    "field.required_named": "El campo {name} es requerido",
-    # TextField
-    "text.minlength": "La longitud mínima es {min}",
-    "text.maxlength": "La longitud máxima es {max}",
-    "text.pattern_mismatch": "El valor no coincide con el patrón requerido",
-    "text.invalid_regex": "Patrón regex inválido",
-    # EmailField
-    "email.invalid": "Email inválido",
-    # NumberField
-    "number.min_value": "El valor debe ser mayor o igual a {min}",
-    "number.max_value": "El valor debe ser menor o igual a {max}",
-    "number.invalid": "Debe ser un número válido",
-    # DateField
-    "date.min_date": "La fecha debe ser posterior a {min}",
-    "date.max_date": "La fecha debe ser anterior a {max}",
-    "date.invalid_format": "Debe ser una fecha válida en formato YYYY-MM-DD",
-    # SelectField
-    "select.invalid_option": "Opción inválida seleccionada",
-    "select.invalid_options": "Opciones inválidas seleccionadas",
-    "select.invalid_option_value": "Opción inválida: {value}. Debe ser una de: {valid}",
-    "select.invalid_values": "Valores inválidos: {values}",
-    "select.min_selected": "Debe seleccionar al menos {min} opciones",
-    "select.max_selected": "Puede seleccionar máximo {max} opciones",
-    "select.value_must_be_list": "El valor debe ser una lista",
-    "select.min_selected_negative": "min_selected no puede ser negativo",
-    "select.min_selected_requires_multiple": "min_selected solo puede usarse con multiple=True",
-    "select.max_selected_min_value": "max_selected debe ser mayor que 0",
-    "select.max_selected_requires_multiple": "max_selected solo puede usarse con multiple=True",
-    "select.max_less_than_min": "max_selected debe ser mayor o igual que min_selected",
-    "select.invalid_value_must_be_one_of": "Valor inválido. Debe ser uno de: {valid}",
-    # RadioField
-    "radio.invalid_option": "Opción inválida seleccionada",
-    "radio.default_must_be_string": "El valor por defecto debe ser una cadena",
-    # CheckboxField
-    "checkbox.must_be_boolean": "Debe ser un valor booleano",
-    "checkbox.default_must_be_boolean": "El valor por defecto debe ser un booleano",
-    # CheckboxGroupField
-    "checkbox_group.default_must_be_list": "El valor por defecto debe ser una lista de valores",
-    "checkbox_group.invalid_options": "Opciones inválidas seleccionadas",
-    # UrlField
-    "url.invalid_scheme": "La URL debe comenzar con http:// o https://",
-    # Formulario
-    "form.unique_field_names": "Los nombres de los campos deben ser únicos en el formulario",
-    "form.unique_field_names_in_group": "Los nombres de los campos deben ser únicos dentro del grupo '{title}'",
-    "form.validation_success": "Datos validados correctamente",
-    "form.validation_error": "Error en la validación",
-    "form.data_validation_error": "Error en la validación de datos",
-    # Exportación / HTML
-    "export.fix_errors": "Por favor corrija los siguientes errores:",
-    "export.submit": "Enviar",
-    "export.field_required": "El campo {label} es requerido",
-    # Wizard / Multi-paso
-    "wizard.not_a_wizard_form": "Este formulario no está configurado como wizard (no se encontraron pasos)",
-    "wizard.invalid_step_index": "Índice de paso inválido {index}, debe estar entre 0 y {max}",
-    "wizard.step_validation_failed": "La validación falló para el paso {step}",
-    "wizard.validation_failed": "La validación del wizard falló",
-    # Visibilidad
-    "visibility.unknown_operator": "Operador de visibilidad desconocido: {operator}",
-}
+import string
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
 
+from codeforms.locales import en as _en
+from codeforms.locales import es as _es
 
 # --- Registry ---
 
+
+def _intern_keys(messages: Dict[str, str]) -> Dict[str, str]:
+    """Return *messages* with interned keys, matching ``codeforms.i18n_keys``."""
+    return {sys.intern(key): message for key, message in messages.items()}
+
+
+_MESSAGES_EN = _intern_keys(_en.MESSAGES)
+_MESSAGES_ES = _intern_keys(_es.MESSAGES)
+
 _locales: Dict[str, Dict[str, str]] = {
     "en": _MESSAGES_EN,
     "es": _MESSAGES_ES,
 }
 
-_current_locale: str = "en"
+# Per-locale renderers for templates with ``{placeholder}`` fields, built once
+# at registration time so ``t()`` does not re-parse the format string.
+_Renderer = Callable[[Dict[str, Any]], str]
+_compiled: Dict[str, Dict[str, _Renderer]] = {}
+
+
+def _compile_message(template: str) -> Optional[_Renderer]:
+    """
+    Compile a message template into an f-string renderer taking the kwargs.
+
+    ``"The field {name} is required"`` becomes, in effect,
+    ``def _render(k): return f"{_l0}{k['name']}{_l1}"``.  Literal text and
+    format specs are bound as namespace constants, so only validated
+    placeholder names ever appear in the generated source.
+
+    Returns None for templates without placeholders and for anything
+    outside the plain ``{name[!conv][:spec]}`` subset (positional or
+    attribute fields, nested specs, malformed braces); those keep going
+    through ``str.format``.
+    """
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return None
+
+    namespace: Dict[str, Any] = {}
+    parts = []
+    has_fields = False
+    for i, (literal, name, spec, conversion) in enumerate(parsed):
+        if literal:
+            namespace[f"_l{i}"] = literal
+            parts.append(f"{{_l{i}}}")
+        if name is None:
+            continue
+        if (
+            not name.isidentifier()
+            or "{" in spec
+            or conversion not in (None, "s", "r", "a")
+        ):
+            return None
+        has_fields = True
+        expr = f"k[{name!r}]"
+        if conversion:
+            expr += f"!{conversion}"
+        if spec:
+            namespace[f"_s{i}"] = spec
+            expr += f":{{_s{i}}}"
+        parts.append(f"{{{expr}}}")
+
+    if not has_fields:
+        return None
+
+    source = 'def _render(k):\n    return f"' + "".join(parts) + '"\n'
+    exec(compile(source, "<codeforms-i18n>", "exec"), namespace)
+    return namespace["_render"]
+
+
+def _compile_messages(locale: str, messages: Dict[str, str]) -> None:
+    """(Re)build the renderers for *messages* in *locale*."""
+    compiled = _compiled.setdefault(locale, {})
+    for key, template in messages.items():
+        render = _compile_message(template)
+        if render is None:
+            compiled.pop(key, None)
+        else:
+            compiled[key] = render
+
+
+for _locale, _messages in _locales.items():
+    _compile_messages(_locale, _messages)
+
+# Current locale and its catalog.  set_locale() changes the process-wide
+# default; use_locale() overrides it for the running thread / asyncio task
+# through a ContextVar (None = no override).  The catalog travels with the
+# code so t() skips the _locales[locale] indirection.
+_default_locale: Tuple[str, Dict[str, str]] = ("en", _MESSAGES_EN)
+_locale_override: ContextVar[Optional[Tuple[str, Dict[str, str]]]] = ContextVar(
+    "codeforms_locale", default=None
+)
+
+
+def _current_locale() -> Tuple[str, Dict[str, str]]:
+    return _locale_override.get() or _default_locale
+
+
+def _checked_locale(locale: str) -> Tuple[str, Dict[str, str]]:
+    if locale not in _locales:
+        available = ", ".join(sorted(_locales.keys()))
+        raise ValueError(f"Unknown locale '{locale}'. Available locales: {available}")
+    return locale, _locales[locale]
 
 
 # --- Public API ---
@@ -172,12 +153,32 @@ _current_locale: str = "en"
 
 def get_locale() -> str:
     """Return the current locale code (e.g. 'en', 'es')."""
-    return _current_locale
+    return _current_locale()[0]
 
 
 def set_locale(locale: str) -> None:
     """
-    Set the current locale.
+    Set the current locale for the whole process.
+
+    Contexts inside ``use_locale()`` keep their override.
+
+    Args:
+        locale: A locale code that has been registered (e.g. 'en', 'es').
+
+    Raises:
+        ValueError: If the locale has not been registered.
+    """
+    global _default_locale
+    _default_locale = _checked_locale(locale)
+
+
+@contextmanager
+def use_locale(locale: str) -> Iterator[None]:
+    """
+    Override the locale for the running context (thread or asyncio task).
+
+    Other threads and tasks keep using the process-wide locale; the previous
+    locale is restored on exit.
 
     Args:
         locale: A locale code that has been registered (e.g. 'en', 'es').
@@ -185,11 +186,11 @@ def set_locale(locale: str) -> None:
     Raises:
         ValueError: If the locale has not been registered.
     """
-    global _current_locale
-    if locale not in _locales:
-        available = ", ".join(sorted(_locales.keys()))
-        raise ValueError(f"Unknown locale '{locale}'. Available locales: {available}")
-    _current_locale = locale
+    token = _locale_override.set(_checked_locale(locale))
+    try:
+        yield
+    finally:
+        _locale_override.reset(token)
 
 
 def get_available_locales() -> list[str]:
@@ -208,21 +209,27 @@ def register_locale(locale: str, messages: Dict[str, str]) -> None:
         locale: Locale code (e.g. 'fr', 'pt').
         messages: Dict mapping message keys to translated strings.
     """
+    messages = _intern_keys(messages)
     if locale in _locales:
         _locales[locale].update(messages)
     else:
-        _locales[locale] = dict(messages)
+        _locales[locale] = messages
+    _compile_messages(locale, messages)
+    _interpolate_cached.cache_clear()
 
 
-def get_messages(locale: Optional[str] = None) -> Dict[str, str]:
+def get_messages(locale: Optional[str] = None) -> Mapping[str, str]:
     """
-    Return a *copy* of the message catalog for the given locale.
+    Return a read-only view of the message catalog for the given locale.
+
+    The view reflects later ``register_locale`` updates; use ``dict(...)``
+    for a mutable snapshot.
 
     Args:
         locale: Locale code.  Defaults to the current locale.
     """
-    loc = locale or _current_locale
-    return copy.copy(_locales.get(loc, _locales["en"]))
+    loc = locale or get_locale()
+    return MappingProxyType(_locales.get(loc, _locales["en"]))
 
 
 def t(key: str, **kwargs: Any) -> str:
@@ -240,14 +247,41 @@ def t(key: str, **kwargs: Any) -> str:
         If the key is not found in the current locale, falls back to the
         English catalog.  If still not found, returns the key itself.
     """
-    messages = _locales.get(_current_locale, _locales["en"])
+    locale, messages = _current_locale()
     template = messages.get(key)
+    if not kwargs:
+        # Fast path: nothing to interpolate
+        return template if template is not None else _MESSAGES_EN.get(key, key)
+
+    # Only exact str/int values are memoized: for them equal values always
+    # render identically. Equal floats, Decimals or tuples may not (18 vs
+    # 18.0, Decimal("1.0") vs Decimal("1.00"), 0.0 vs -0.0).
+    for v in kwargs.values():
+        if type(v) not in _MEMO_TYPES:
+            return _interpolate(locale, key, kwargs)
+    return _interpolate_cached(locale, key, tuple(sorted(kwargs.items())))
+
+
+def _interpolate(locale: str, key: str, kwargs: Dict[str, Any]) -> str:
+    template = _locales[locale].get(key)
+    compiled = _compiled[locale]
     if template is None:
         # Fallback to English
         template = _MESSAGES_EN.get(key, key)
-    if kwargs:
-        try:
-            return template.format(**kwargs)
-        except (KeyError, IndexError):
-            return template
-    return template
+        compiled = _compiled["en"]
+    render = compiled.get(key)
+    try:
+        if render is not None:
+            return render(kwargs)
+        return template.format(**kwargs)
+    except (KeyError, IndexError):
+        return template
+
+
+_MEMO_TYPES = frozenset({str, int})
+
+
+@lru_cache(maxsize=2048)
+def _interpolate_cached(locale: str, key: str, items: tuple) -> str:
+    """Memoized ``_interpolate`` for str/int kwargs; cleared by ``register_locale``."""
+    return _interpolate(locale, key, dict(items))
@@ -0,0 +1,75 @@
+"""
+Message keys used internally by codeforms.
+
+Every key is interned, and so are the catalog keys (see
+``codeforms.i18n``), so catalog lookups in ``t()`` match on identity
+without a full string comparison.
+"""
+
+import sys
+from typing import Final
+
+FIELD_REQUIRED: Final = sys.intern("field.required")
+FIELD_REQUIRED_NAMED: Final = sys.intern("field.required_named")
+
+TEXT_MINLENGTH: Final = sys.intern("text.minlength")
+TEXT_MAXLENGTH: Final = sys.intern("text.maxlength")
+TEXT_PATTERN_MISMATCH: Final = sys.intern("text.pattern_mismatch")
+TEXT_INVALID_REGEX: Final = sys.intern("text.invalid_regex")
+
+EMAIL_INVALID: Final = sys.intern("email.invalid")
+
+NUMBER_MIN_VALUE: Final = sys.intern("number.min_value")
+NUMBER_MAX_VALUE: Final = sys.intern("number.max_value")
+NUMBER_INVALID: Final = sys.intern("number.invalid")
+
+DATE_MIN_DATE: Final = sys.intern("date.min_date")
+DATE_MAX_DATE: Final = sys.intern("date.max_date")
+DATE_INVALID_FORMAT: Final = sys.intern("date.invalid_format")
+
+SELECT_INVALID_OPTION: Final = sys.intern("select.invalid_option")
+SELECT_INVALID_OPTIONS: Final = sys.intern("select.invalid_options")
+SELECT_INVALID_OPTION_VALUE: Final = sys.intern("select.invalid_option_value")
+SELECT_INVALID_VALUES: Final = sys.intern("select.invalid_values")
+SELECT_MIN_SELECTED: Final = sys.intern("select.min_selected")
+SELECT_MAX_SELECTED: Final = sys.intern("select.max_selected")
+SELECT_VALUE_MUST_BE_LIST: Final = sys.intern("select.value_must_be_list")
+SELECT_MIN_SELECTED_NEGATIVE: Final = sys.intern("select.min_selected_negative")
+SELECT_MIN_SELECTED_REQUIRES_MULTIPLE: Final = sys.intern(
+    "select.min_selected_requires_multiple"
+)
+SELECT_MAX_SELECTED_MIN_VALUE: Final = sys.intern("select.max_selected_min_value")
+SELECT_MAX_SELECTED_REQUIRES_MULTIPLE: Final = sys.intern(
+    "select.max_selected_requires_multiple"
+)
+SELECT_MAX_LESS_THAN_MIN: Final = sys.intern("select.max_less_than_min")
+SELECT_INVALID_VALUE_MUST_BE_ONE_OF: Final = sys.intern(
+    "select.invalid_value_must_be_one_of"
+)
+
+RADIO_INVALID_OPTION: Final = sys.intern("radio.invalid_option")
+RADIO_DEFAULT_MUST_BE_STRING: Final = sys.intern("radio.default_must_be_string")
+
+CHECKBOX_MUST_BE_BOOLEAN: Final = sys.intern("checkbox.must_be_boolean")
+CHECKBOX_DEFAULT_MUST_BE_BOOLEAN: Final = sys.intern("checkbox.default_must_be_boolean")
+
+CHECKBOX_GROUP_DEFAULT_MUST_BE_LIST: Final = sys.intern(
+    "checkbox_group.default_must_be_list"
+)
+CHECKBOX_GROUP_INVALID_OPTIONS: Final = sys.intern("checkbox_group.invalid_options")
+
+URL_INVALID_SCHEME: Final = sys.intern("url.invalid_scheme")
+
+FORM_UNIQUE_FIELD_NAMES: Final = sys.intern("form.unique_field_names")
+FORM_UNIQUE_FIELD_NAMES_IN_GROUP: Final = sys.intern("form.unique_field_names_in_group")
+FORM_VALIDATION_SUCCESS: Final = sys.intern("form.validation_success")
+FORM_VALIDATION_ERROR: Final = sys.intern("form.validation_error")
+FORM_DATA_VALIDATION_ERROR: Final = sys.intern("form.data_validation_error")
+
+EXPORT_FIX_ERRORS: Final = sys.intern("export.fix_errors")
+EXPORT_SUBMIT: Final = sys.intern("export.submit")
+EXPORT_FIELD_REQUIRED: Final = sys.intern("export.field_required")
+
+WIZARD_NOT_A_WIZARD_FORM: Final = sys.intern("wizard.not_a_wizard_form")
+WIZARD_INVALID_STEP_INDEX: Final = sys.intern("wizard.invalid_step_index")
+WIZARD_VALIDATION_FAILED: Final = sys.intern("wizard.validation_failed")
@@ -0,0 +1,7 @@
+"""
+Bundled message catalogs, one module per locale exposing ``MESSAGES``.
+
+Keeping them as plain modules lets the import system cache their bytecode,
+so the catalogs load from ``.pyc`` instead of being re-parsed.  Additional
+locales are added at runtime with ``codeforms.i18n.register_locale``.
+"""
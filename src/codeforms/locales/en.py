@@ -0,0 +1,66 @@
+"""English message catalog (default and fallback locale)."""
+
+from typing import Dict
+
+MESSAGES: Dict[str, str] = {
+    # Field-level validation
+    "field.required": "This field is required",
+    "field.required_named": "The field {name} is required",
+    # TextField
+    "text.minlength": "Minimum length is {min}",
+    "text.maxlength": "Maximum length is {max}",
+    "text.pattern_mismatch": "Value does not match the required pattern",
+    "text.invalid_regex": "Invalid regex pattern",
+    # EmailField
+    "email.invalid": "Invalid email",
+    # NumberField
+    "number.min_value": "Value must be greater than or equal to {min}",
+    "number.max_value": "Value must be less than or equal to {max}",
+    "number.invalid": "Must be a valid number",
+    # DateField
+    "date.min_date": "Date must be after {min}",
+    "date.max_date": "Date must be before {max}",
+    "date.invalid_format": "Must be a valid date in YYYY-MM-DD format",
+    # SelectField
+    "select.invalid_option": "Invalid option selected",
+    "select.invalid_options": "Invalid options selected",
+    "select.invalid_option_value": "Invalid option: {value}. Must be one of: {valid}",
+    "select.invalid_values": "Invalid values: {values}",
+    "select.min_selected": "Must select at least {min} options",
+    "select.max_selected": "Can select at most {max} options",
+    "select.value_must_be_list": "Value must be a list",
+    "select.min_selected_negative": "min_selected cannot be negative",
+    "select.min_selected_requires_multiple": "min_selected can only be used with multiple=True",
+    "select.max_selected_min_value": "max_selected must be greater than 0",
+    "select.max_selected_requires_multiple": "max_selected can only be used with multiple=True",
+    "select.max_less_than_min": "max_selected must be greater than or equal to min_selected",
+    "select.invalid_value_must_be_one_of": "Invalid value. Must be one of: {valid}",
+    # RadioField
+    "radio.invalid_option": "Invalid option selected",
+    "radio.default_must_be_string": "Default value must be a string",
+    # CheckboxField
+    "checkbox.must_be_boolean": "Must be a boolean value",
+    "checkbox.default_must_be_boolean": "Default value must be a boolean",
+    # CheckboxGroupField
+    "checkbox_group.default_must_be_list": "Default value must be a list of values",
+    "checkbox_group.invalid_options": "Invalid options selected",
+    # UrlField
+    "url.invalid_scheme": "URL must start with http:// or https://",
+    # Form-level
+    "form.unique_field_names": "Field names must be unique in the form",
+    "form.unique_field_names_in_group": "Field names must be unique within group '{title}'",
+    "form.validation_success": "Data validated successfully",
+    "form.validation_error": "Validation error",
+    "form.data_validation_error": "Data validation error",
+    # Export / HTML
+    "export.fix_errors": "Please fix the following errors:",
+    "export.submit": "Submit",
+    "export.field_required": "The field {label} is required",
+    # Wizard / Multi-step
+    "wizard.not_a_wizard_form": "This form is not configured as a wizard (no steps found)",
+    "wizard.invalid_step_index": "Invalid step index {index}, must be between 0 and {max}",
+    "wizard.step_validation_failed": "Validation failed for step {step}",
+    "wizard.validation_failed": "Wizard validation failed",
+    # Visibility
+    "visibility.unknown_operator": "Unknown visibility operator: {operator}",
+}
@@ -0,0 +1,66 @@
+"""Spanish message catalog."""
+
+from typing import Dict
+
+MESSAGES: Dict[str, str] = {
+    # Validación a nivel de campo
+    "field.required": "Este campo es requerido",
+    "field.required_named": "El campo {name} es requerido",
+    # TextField
+    "text.minlength": "La longitud mínima es {min}",
+    "text.maxlength": "La longitud máxima es {max}",
+    "text.pattern_mismatch": "El valor no coincide con el patrón requerido",
+    "text.invalid_regex": "Patrón regex inválido",
+    # EmailField
+    "email.invalid": "Email inválido",
+    # NumberField
+    "number.min_value": "El valor debe ser mayor o igual a {min}",
+    "number.max_value": "El valor debe ser menor o igual a {max}",
+    "number.invalid": "Debe ser un número válido",
+    # DateField
+    "date.min_date": "La fecha debe ser posterior a {min}",
+    "date.max_date": "La fecha debe ser anterior a {max}",
+    "date.invalid_format": "Debe ser una fecha válida en formato YYYY-MM-DD",
+    # SelectField
+    "select.invalid_option": "Opción inválida seleccionada",
+    "select.invalid_options": "Opciones inválidas seleccionadas",
+    "select.invalid_option_value": "Opción inválida: {value}. Debe ser una de: {valid}",
+    "select.invalid_values": "Valores inválidos: {values}",
+    "select.min_selected": "Debe seleccionar al menos {min} opciones",
+    "select.max_selected": "Puede seleccionar máximo {max} opciones",
+    "select.value_must_be_list": "El valor debe ser una lista",
+    "select.min_selected_negative": "min_selected no puede ser negativo",
+    "select.min_selected_requires_multiple": "min_selected solo puede usarse con multiple=True",
+    "select.max_selected_min_value": "max_selected debe ser mayor que 0",
+    "select.max_selected_requires_multiple": "max_selected solo puede usarse con multiple=True",
+    "select.max_less_than_min": "max_selected debe ser mayor o igual que min_selected",
+    "select.invalid_value_must_be_one_of": "Valor inválido. Debe ser uno de: {valid}",
+    # RadioField
+    "radio.invalid_option": "Opción inválida seleccionada",
+    "radio.default_must_be_string": "El valor por defecto debe ser una cadena",
+    # CheckboxField
+    "checkbox.must_be_boolean": "Debe ser un valor booleano",
+    "checkbox.default_must_be_boolean": "El valor por defecto debe ser un booleano",
+    # CheckboxGroupField
+    "checkbox_group.default_must_be_list": "El valor por defecto debe ser una lista de valores",
+    "checkbox_group.invalid_options": "Opciones inválidas seleccionadas",
+    # UrlField
+    "url.invalid_scheme": "La URL debe comenzar con http:// o https://",
+    # Formulario
+    "form.unique_field_names": "Los nombres de los campos deben ser únicos en el formulario",
+    "form.unique_field_names_in_group": "Los nombres de los campos deben ser únicos dentro del grupo '{title}'",
+    "form.validation_success": "Datos validados correctamente",
+    "form.validation_error": "Error en la validación",
+    "form.data_validation_error": "Error en la validación de datos",
+    # Exportación / HTML
+    "export.fix_errors": "Por favor corrija los siguientes errores:",
+    "export.submit": "Enviar",
+    "export.field_required": "El campo {label} es requerido",
+    # Wizard / Multi-paso
+    "wizard.not_a_wizard_form": "Este formulario no está configurado como wizard (no se encontraron pasos)",
+    "wizard.invalid_step_index": "Índice de paso inválido {index}, debe estar entre 0 y {max}",
+    "wizard.step_validation_failed": "La validación falló para el paso {step}",
+    "wizard.validation_failed": "La validación del wizard falló",
+    # Visibilidad
+    "visibility.unknown_operator": "Operador de visibilidad desconocido: {operator}",
+}
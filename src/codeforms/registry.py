@@ -17,15 +17,18 @@ Usage:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Type
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Type
 
 if TYPE_CHECKING:
     from codeforms.fields import FormFieldBase
 
 
-# Maps field_type string value → list of candidate classes.
+# Maps field_type string value → candidate classes, as an insertion-ordered
+# set (dict with None values) so duplicate checks are O(1).
 # Multiple classes may share a field_type (e.g. CheckboxField / CheckboxGroupField).
-_field_type_registry: Dict[str, List[Type[FormFieldBase]]] = {}
+_field_type_registry: Dict[str, Dict[Type[FormFieldBase], None]] = {}
 _registry_initialized: bool = False
 
 
@@ -42,16 +45,48 @@ def _get_field_type_key(cls: Type[FormFieldBase]) -> str:
     default = field_info.default
     if default is None:
         raise ValueError(f"{cls.__name__} must define a default field_type value")
-    return default.value if hasattr(default, "value") else str(default)
+    # Interned so lookups with interned input strings match on identity
+    return sys.intern(default.value if hasattr(default, "value") else str(default))
 
 
 def _register_class(cls: Type[FormFieldBase]) -> None:
     """Add a class to the internal registry (idempotent)."""
-    key = _get_field_type_key(cls)
-    if key not in _field_type_registry:
-        _field_type_registry[key] = []
-    if cls not in _field_type_registry[key]:
-        _field_type_registry[key].append(cls)
+    candidates = _field_type_registry.setdefault(_get_field_type_key(cls), {})
+    if cls not in candidates:
+        candidates[cls] = None
+        _resolve_class.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _resolve_class(
+    field_type: str, key_signature: FrozenSet[str]
+) -> Type[FormFieldBase]:
+    """
+    Pick the registered class for *field_type* given the input's keys.
+
+    Cached on (field_type, keys other than ``field_type``); cleared whenever
+    a class is registered.
+
+    Raises:
+        ValueError: If ``field_type`` is unknown.
+    """
+    candidates = _field_type_registry.get(field_type)
+    if not candidates:
+        raise ValueError(f"Unknown field type: {field_type!r}")
+
+    if len(candidates) == 1:
+        return next(iter(candidates))
+
+    # Multiple candidates (e.g. CheckboxField / CheckboxGroupField):
+    # pick the class whose declared fields overlap best with the input.
+    best_cls = next(iter(candidates))
+    best_score = -1
+    for cls in candidates:
+        score = sum(1 for f in cls.model_fields if f in key_signature)
+        if score > best_score:
+            best_score = score
+            best_cls = cls
+    return best_cls
 
 
 def _init_builtin_types() -> None:
@@ -175,45 +210,60 @@ def resolve_content_item(item: Any) -> Any:
     if not isinstance(item, dict):
         return item  # already an instance
 
-    # (1) Explicit container type discriminator
-    if "type" in item:
-        container_type = item["type"]
-        if container_type == "step":
-            from codeforms.fields import FormStep
+    field_type = item.get("field_type")
+    key = (
+        item.get("type") == "step",
+        field_type is not None,
+        "title" in item and "field_type" not in item,
+    )
+    return _DISPATCH[key](item, field_type)
 
-            return FormStep.model_validate(item)
-        # Unknown type values fall through to existing heuristics
 
-    # (2) Legacy FieldGroup heuristic (has 'title', no 'field_type')
-    if "title" in item and "field_type" not in item:
-        from codeforms.fields import FieldGroup
+def _build_step(item: Dict[str, Any], field_type: Any) -> Any:
+    from codeforms.fields import FormStep
 
-        return FieldGroup.model_validate(item)
+    return FormStep.model_validate(item)
 
-    # (3) Field type registry lookup
-    field_type = item.get("field_type")
-    if field_type is None:
-        return item
 
-    # Normalise enum → string
-    if hasattr(field_type, "value"):
-        field_type = field_type.value
+def _build_field_group(item: Dict[str, Any], field_type: Any) -> Any:
+    from codeforms.fields import FieldGroup
 
-    candidates = _field_type_registry.get(field_type)
-    if not candidates:
-        raise ValueError(f"Unknown field type: {field_type!r}")
+    return FieldGroup.model_validate(item)
 
-    if len(candidates) == 1:
-        return candidates[0].model_validate(item)
 
-    # Multiple candidates (e.g. CheckboxField / CheckboxGroupField):
-    # pick the class whose declared fields overlap best with the input.
-    best_cls = candidates[0]
-    best_score = -1
-    for cls in candidates:
-        score = sum(1 for f in cls.model_fields if f in item)
-        if score > best_score:
-            best_score = score
-            best_cls = cls
-
-    return best_cls.model_validate(item)
+def _build_field(item: Dict[str, Any], field_type: Any) -> Any:
+    # Normalise enum → string
+    if hasattr(field_type, "value"):
+        field_type = field_type.value
+    if type(field_type) is str:
+        field_type = sys.intern(field_type)
+
+    key_signature = frozenset(item).difference(("field_type",))
+    return _resolve_class(field_type, key_signature).model_validate(item)
+
+
+def _pass_through(item: Dict[str, Any], field_type: Any) -> Any:
+    return item
+
+
+def _dispatch_for(is_step: bool, has_field_type: bool, is_group: bool) -> Any:
+    # Same precedence as the documented resolution order: an explicit
+    # type="step" wins, then field_type, then the legacy title heuristic.
+    # Unknown type values fall through to the other rules.
+    if is_step:
+        return _build_step
+    if has_field_type:
+        return _build_field
+    if is_group:
+        return _build_field_group
+    return _pass_through
+
+
+# (is type="step", has a non-None field_type, has title and no field_type key)
+# → builder.  All eight combinations are precomputed.
+_DISPATCH = {
+    (a, b, c): _dispatch_for(a, b, c)
+    for a in (False, True)
+    for b in (False, True)
+    for c in (False, True)
+}
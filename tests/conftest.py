@@ -3,8 +3,56 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(scope="session")
+def cached_schema():
+    """form_to_json_schema memoized per Form instance, for read-only assertions.
+
+    Entries keep a reference to their form, so an id() cannot be reused by a
+    different form while cached; the identity check guards it anyway.
+    """
+    from codeforms import form_to_json_schema
+
+    cache = {}
+
+    def get(form):
+        entry = cache.get(id(form))
+        if entry is None or entry[0] is not form:
+            entry = cache[id(form)] = (form, form_to_json_schema(form))
+        return entry[1]
+
+    return get
+
+
+@pytest.fixture(scope="module")
+def two_step_form():
+    """Read-only wizard form: two steps, the second with a nested group."""
+    from codeforms import EmailField, FieldGroup, Form, FormStep, TextField
+
+    return Form(
+        name="wizard",
+        content=[
+            FormStep(
+                title="Step 1",
+                content=[TextField(name="name", label="Name", required=True)],
+            ),
+            FormStep(
+                title="Step 2",
+                content=[
+                    EmailField(name="email", label="Email", required=True),
+                    FieldGroup(
+                        title="Inner",
+                        fields=[TextField(name="notes", label="Notes")],
+                    ),
+                ],
+            ),
+        ],
+    )
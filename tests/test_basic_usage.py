@@ -1,9 +1,21 @@
 from __future__ import annotations
 
 import importlib.util
+import json
 from pathlib import Path
 
-from codeforms import EmailField, Form, TextField, validate_form_data
+import pytest
+from pydantic import ValidationError
+
+from codeforms import (
+    EmailField,
+    Form,
+    FormDataValidator,
+    SelectField,
+    SelectOption,
+    TextField,
+    validate_form_data,
+)
 
 
 def _load_example_module():
@@ -81,6 +93,13 @@ def test_product_form_json_roundtrip_keeps_validation():
     assert result["data"] == valid_data
 
 
+def test_product_form_to_dict_matches_json_and_loads_from_bytes():
+    form = _load_example_module().create_product_form()
+
+    assert form.to_dict() == json.loads(form.model_dump_json(exclude_none=True))
+    assert Form.loads(form.model_dump_json().encode()).to_dict() == form.to_dict()
+
+
 def test_contact_form_defaults_and_bootstrap_export():
     contact_form = Form(
         name="contact_form",
@@ -143,3 +162,138 @@ def test_registration_form_missing_required_terms_fails():
 
     assert result["success"] is False
     assert result["errors"][0]["field"] == "terms"
+
+
+def test_form_data_validator_model_is_reused():
+    form = Form(
+        name="contact",
+        fields=[
+            TextField(name="name", label="Name", required=True),
+            EmailField(name="email", label="Email"),
+        ],
+    )
+
+    model = FormDataValidator.create_model(form)
+
+    assert FormDataValidator.create_model(form) is model
+    assert model.model_validate({"name": "Ada"}).name == "Ada"
+    with pytest.raises(ValidationError):
+        model.model_validate({})
+
+
+def test_form_data_validator_model_rebuilt_after_field_change():
+    form = Form(name="contact", fields=[TextField(name="name", label="Name")])
+    model = FormDataValidator.create_model(form)
+
+    form.fields[0].required = True
+
+    rebuilt = FormDataValidator.create_model(form)
+    assert rebuilt is not model
+    with pytest.raises(ValidationError):
+        rebuilt.model_validate({})
+
+
+def test_select_options_lookup_follows_replaced_options():
+    field = SelectField(
+        name="color",
+        label="Color",
+        options=[SelectOption(value="red", label="Red")],
+    )
+    form = Form(name="pick", fields=[field])
+
+    assert form.validate_data({"color": "red"})["success"] is True
+    assert form.validate_data({"color": ["red"]})["success"] is False
+
+    field.options = (SelectOption(value="blue", label="Blue"),)
+
+    assert form.validate_data({"color": "blue"})["success"] is True
+    assert form.validate_data({"color": "red"})["success"] is False
+
+
+def test_select_export_renders_every_option_in_order():
+    options = [SelectOption(value=f"v{i}", label=f"L{i}") for i in range(200)]
+    options[3] = SelectOption(value="v3", label="L3", selected=True)
+    form = Form(
+        name="pick",
+        fields=[SelectField(name="choice", label="Choice", options=options)],
+    )
+
+    html = form.export(output_format="html")["output"]
+
+    assert html.count("<option ") == 200
+    assert '<option value="v3" selected="selected">L3</option>' in html
+    assert '<option value="v4" >L4</option><option value="v5" >L5</option>' in html
+
+
+def test_validate_data_keeps_form_equal_to_its_json_roundtrip():
+    form = _load_example_module().create_product_form()
+    form.validate_data({"category": "not-an-option"})
+
+    assert form == Form.loads(form.model_dump_json())
+
+
+def test_create_model_does_not_affect_form_equality():
+    form = Form(name="contact", fields=[TextField(name="name", label="Name")])
+    FormDataValidator.create_model(form)
+
+    assert form == Form.loads(form.model_dump_json())
+
+
+def test_options_keep_their_own_fields_set():
+    SelectField(
+        name="a",
+        label="A",
+        options=[SelectOption(value="x", label="X", selected=False)],
+    )
+    field = SelectField(
+        name="b", label="B", options=[SelectOption(value="x", label="X")]
+    )
+
+    dumped = field.model_dump(exclude_unset=True)
+    assert list(dumped["options"]) == [{"value": "x", "label": "X"}]
+
+
+def test_validate_data_uses_overridden_text_validate_value():
+    class UpperTextField(TextField):
+        def validate_value(self, value):
+            if value is not None and value != value.upper():
+                return False, "must be upper case"
+            return super().validate_value(value)
+
+    form = Form(name="f", fields=[UpperTextField(name="code", label="Code")])
+
+    assert form.validate_data({"code": "ABC"})["success"] is True
+    result = form.validate_data({"code": "abc"})
+    assert result["success"] is False
+    assert result["errors"] == [{"field": "code", "message": "must be upper case"}]
+
+
+def test_to_dict_is_json_safe_for_non_finite_floats():
+    form = Form(
+        name="f",
+        fields=[TextField(name="x", label="X", default_value=float("inf"))],
+    )
+
+    assert form.to_dict()["content"][0]["default_value"] is None
+    json.dumps(form.to_dict(), allow_nan=False)
+
+
+def test_cached_data_model_does_not_read_another_forms_fields():
+    def make_form():
+        return Form(
+            name="pick",
+            fields=[
+                SelectField(
+                    name="c",
+                    label="C",
+                    options=[SelectOption(value="x", label="X")],
+                )
+            ],
+        )
+
+    first, second = make_form(), make_form()
+    FormDataValidator.create_model(first)
+    first.fields[0].required = True
+
+    with pytest.raises(ValidationError, match="Invalid value"):
+        FormDataValidator.create_model(second).model_validate({"c": ""})
@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 import json
+import shutil
+import subprocess
+from datetime import date
+
+import pytest
 
 from codeforms import (
     Form,
@@ -135,47 +140,91 @@ class TestEvaluateVisibility:
         assert evaluate_visibility(field, {}) is False
 
 
+class TestCompiledVisibility:
+    RULES = [
+        VisibilityRule(field="country", operator="equals", value="US"),
+        VisibilityRule(field="country", operator="not_equals", value="US"),
+        VisibilityRule(field="country", operator="in", value=["US", "CA"]),
+        VisibilityRule(field="country", operator="not_in", value=["US", "CA"]),
+        VisibilityRule(field="age", operator="gt", value=18),
+        VisibilityRule(field="age", operator="lt", value=65),
+        VisibilityRule(field="other", operator="is_empty"),
+        VisibilityRule(field="other", operator="is_not_empty"),
+        VisibilityRule(field="other", operator="unknown_op", value=1),
+    ]
+    DATA = [
+        {},
+        {"country": "US", "age": 21, "other": ""},
+        {"country": "AR", "age": 70, "other": "x"},
+        {"country": "CA", "age": None, "other": []},
+        {"country": ["US"], "age": 30, "other": None},
+    ]
+
+    def test_compiled_matches_interpreted(self, monkeypatch):
+        from codeforms import forms
+
+        for rule in self.RULES:
+            field = TextField(name="x", label="X", visible_when=[rule])
+            for data in self.DATA:
+                compiled = evaluate_visibility(field, data)
+                monkeypatch.setattr(forms, "_VISIBILITY_CODEGEN", False)
+                interpreted = evaluate_visibility(field, data)
+                monkeypatch.setattr(forms, "_VISIBILITY_CODEGEN", True)
+                assert compiled is interpreted, (rule, data)
+
+    def test_predicate_recompiled_when_rules_replaced(self):
+        field = TextField(
+            name="x",
+            label="X",
+            visible_when=[VisibilityRule(field="a", operator="equals", value=1)],
+        )
+        assert evaluate_visibility(field, {"a": 1}) is True
+        field.visible_when = [VisibilityRule(field="a", operator="equals", value=2)]
+        assert evaluate_visibility(field, {"a": 1}) is False
+
+
 # ---------------------------------------------------------------------------
 # validate_form_data_dynamic
 # ---------------------------------------------------------------------------
 
 
-class TestValidateFormDataDynamic:
-    def _make_form(self):
-        return Form(
-            name="test",
-            fields=[
-                SelectField(
-                    name="country",
-                    label="Country",
-                    required=True,
-                    options=[
-                        SelectOption(value="US", label="US"),
-                        SelectOption(value="AR", label="AR"),
-                    ],
-                ),
-                TextField(
-                    name="state",
-                    label="State",
-                    required=True,
-                    visible_when=[
-                        VisibilityRule(field="country", operator="equals", value="US"),
-                    ],
-                ),
-                TextField(
-                    name="province",
-                    label="Province",
-                    required=True,
-                    visible_when=[
-                        VisibilityRule(field="country", operator="equals", value="AR"),
-                    ],
-                ),
-            ],
-        )
+def _make_country_form() -> Form:
+    return Form(
+        name="test",
+        fields=[
+            SelectField(
+                name="country",
+                label="Country",
+                required=True,
+                options=[
+                    SelectOption(value="US", label="US"),
+                    SelectOption(value="AR", label="AR"),
+                ],
+            ),
+            TextField(
+                name="state",
+                label="State",
+                required=True,
+                visible_when=[
+                    VisibilityRule(field="country", operator="equals", value="US"),
+                ],
+            ),
+            TextField(
+                name="province",
+                label="Province",
+                required=True,
+                visible_when=[
+                    VisibilityRule(field="country", operator="equals", value="AR"),
+                ],
+            ),
+        ],
+    )
+
 
+class TestValidateFormDataDynamic:
     def test_hidden_required_field_skipped(self):
         """When country=US, state is visible and province is hidden."""
-        form = self._make_form()
+        form = _make_country_form()
         result = validate_form_data_dynamic(
             form,
             {"country": "US", "state": "NY"},
@@ -187,7 +236,7 @@ class TestValidateFormDataDynamic:
 
     def test_hidden_required_field_fails_without_respect(self):
         """Without respect_visibility, hidden required field still fails."""
-        form = self._make_form()
+        form = _make_country_form()
         result = validate_form_data_dynamic(
             form,
             {"country": "US", "state": "NY"},
@@ -197,7 +246,7 @@ class TestValidateFormDataDynamic:
         assert any(e["field"] == "province" for e in result["errors"])
 
     def test_all_visible_fields_validated(self):
-        form = self._make_form()
+        form = _make_country_form()
         result = validate_form_data_dynamic(
             form,
             {"country": "AR", "province": "Buenos Aires"},
@@ -208,7 +257,7 @@ class TestValidateFormDataDynamic:
 
     def test_legacy_validate_form_data_not_affected(self):
         """validate_form_data ignores visible_when completely."""
-        form = self._make_form()
+        form = _make_country_form()
         result = validate_form_data(
             form,
             {"country": "US", "state": "NY"},
@@ -217,6 +266,129 @@ class TestValidateFormDataDynamic:
         assert result["success"] is False
 
 
+class TestJsVisibility:
+    def test_only_fields_with_rules_are_emitted(self):
+        form = _make_country_form()
+        predicates = form.to_js_visibility()
+        assert set(predicates) == {"state", "province"}
+        assert predicates["state"] == (
+            "function(d){const _b=(k,v)=>typeof v==='boolean'?+v:v;"
+            "const g=(k)=>_b(k,Object.prototype.hasOwnProperty.call(d,k)?d[k]??null:null);"
+            'return g("country") === "US";}'
+        )
+
+    def test_literals_are_escaped_for_script_tags(self):
+        form = Form(
+            name="test",
+            fields=[
+                TextField(
+                    name="x",
+                    label="X",
+                    visible_when=[
+                        VisibilityRule(field="a", operator="in", value=["</script>"])
+                    ],
+                )
+            ],
+        )
+        js = form.to_js_visibility()["x"]
+        assert "</script>" not in js
+        assert '["\\u003c/script\\u003e"].includes' in js
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_js_matches_python_evaluation(self):
+        cases = [
+            ("equals", "US", ["US", "USA", None, 1]),
+            ("equals", 1, [1, 1.5, "1", None]),
+            ("equals", ["a", "b"], [["a", "b"], ["b", "a"], "a", None]),
+            ("not_equals", ["a"], [["a"], [], None]),
+            ("in", ["US", "AR"], ["US", "BR", None, ["US"]]),
+            ("in", "USA", ["US", "SA", "X", ""]),
+            ("not_in", "USA", ["US", "X"]),
+            ("in", None, ["x", None]),
+            ("not_in", ["a"], ["a", "b", None]),
+            ("gt", 5, [6, 5, 5.5, None]),
+            ("lt", "m", ["a", "z", None]),
+            ("is_empty", None, [None, "", [], "x", [1]]),
+            ("is_not_empty", None, [None, "", [], "x", [1]]),
+            # Python: True == 1, False == 0 (also inside lists and sets)
+            ("equals", 1, [True, False]),
+            ("equals", 0, [False, True]),
+            ("equals", True, [1, 1.0, True, 0, "true"]),
+            ("not_equals", False, [0, False, 1]),
+            ("in", [0, 1], [False, True, 2]),
+            ("in", [True], [1, 0, True]),
+            ("not_in", [False], [0, 1]),
+            ("equals", [True, 2], [[1, 2], [True, 2], [0, 2]]),
+        ]
+        # Keys inherited from Object.prototype: absent from data → None
+        keyed_cases = [
+            ("constructor", "is_empty", None, [None]),
+            ("toString", "equals", None, [None, "x"]),
+            ("valueOf", "is_not_empty", None, [None, "x"]),
+            ("__proto__", "is_empty", None, [None]),
+        ]
+        cases = [("v", *case) for case in cases] + keyed_cases
+        fields = [
+            TextField(
+                name=f"f{i}",
+                label="F",
+                visible_when=[VisibilityRule(field=key, operator=op, value=value)],
+            )
+            for i, (key, op, value, _) in enumerate(cases)
+        ]
+        predicates = Form(name="parity", fields=fields).to_js_visibility()
+
+        checks, expected = [], []
+        for field, (key, _, _, samples) in zip(fields, cases):
+            for sample in samples:
+                data = {} if sample is None else {key: sample}
+                checks.append((field.name, data))
+                expected.append(evaluate_visibility(field, data))
+
+        script = (
+            "const p = {"
+            + ",".join(f"{json.dumps(n)}: {js}" for n, js in predicates.items())
+            + "};\n"
+            + f"const checks = {json.dumps(checks)};\n"
+            + "console.log(JSON.stringify(checks.map(([n, d]) => p[n](d))));"
+        )
+        out = subprocess.run(
+            ["node", "-e", script], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert json.loads(out) == expected
+
+    @pytest.mark.parametrize(
+        "operator, value",
+        [
+            ("equals", date(2024, 1, 1)),
+            ("equals", {"a": 1}),
+            ("in", [["nested"]]),
+            ("in", {"a": 1}),
+            ("gt", date(2024, 1, 1)),
+        ],
+    )
+    def test_untranslatable_values_raise(self, operator, value):
+        form = Form(
+            name="test",
+            fields=[
+                TextField(
+                    name="x",
+                    label="X",
+                    visible_when=[
+                        VisibilityRule(field="a", operator=operator, value=value)
+                    ],
+                )
+            ],
+        )
+        with pytest.raises(ValueError, match="cannot be translated to JavaScript"):
+            form.to_js_visibility()
+
+    def test_model_dump_json_unchanged(self):
+        form = _make_country_form()
+        assert "compiled_js" not in json.loads(form.model_dump_json())
+
+
 # ---------------------------------------------------------------------------
 # Serialization of visible_when
 # ---------------------------------------------------------------------------
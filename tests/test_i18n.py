@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+from decimal import Decimal
+
 import pytest
 
 from codeforms import (
@@ -19,11 +22,14 @@ from codeforms import (
     get_available_locales,
     get_locale,
     get_messages,
+    i18n_keys,
     register_locale,
     set_locale,
     t,
+    use_locale,
     validate_form_data,
 )
+from codeforms.i18n import _locales
 
 
 @pytest.fixture(autouse=True)
@@ -48,6 +54,38 @@ class TestLocaleManagement:
         set_locale("es")
         assert get_locale() == "es"
 
+    def test_set_locale_is_process_wide(self):
+        set_locale("es")
+        seen = []
+        worker = threading.Thread(
+            target=lambda: seen.append((get_locale(), t("field.required")))
+        )
+        worker.start()
+        worker.join()
+        assert seen == [("es", "Este campo es requerido")]
+
+    def test_use_locale_overrides_only_current_thread(self):
+        seen = []
+        with use_locale("es"):
+            worker = threading.Thread(target=lambda: seen.append(get_locale()))
+            worker.start()
+            worker.join()
+            assert get_locale() == "es"
+            assert t("field.required") == "Este campo es requerido"
+        assert seen == ["en"]
+        assert get_locale() == "en"
+
+    def test_use_locale_survives_set_locale_and_restores(self):
+        with use_locale("es"):
+            set_locale("en")
+            assert get_locale() == "es"
+        assert get_locale() == "en"
+
+    def test_use_locale_unknown_raises(self):
+        with pytest.raises(ValueError, match="Unknown locale"), use_locale("xx"):
+            pass
+        assert get_locale() == "en"
+
     def test_set_locale_unknown_raises(self):
         with pytest.raises(ValueError, match="Unknown locale"):
             set_locale("xx")
@@ -71,9 +109,11 @@ class TestLocaleManagement:
         # New key available
         assert t("custom.key") == "Valor personalizado"
 
-    def test_get_messages_returns_copy(self):
+    def test_get_messages_is_read_only(self):
         msgs = get_messages("en")
-        msgs["field.required"] = "CHANGED"
+        assert msgs["field.required"] == "This field is required"
+        with pytest.raises(TypeError):
+            msgs["field.required"] = "CHANGED"
         # Original not affected
         assert t("field.required") == "This field is required"
 
@@ -95,9 +135,50 @@ class TestTranslationFunction:
         msg = t("field.required_named", name="email")
         assert msg == "El campo email es requerido"
 
+    def test_internal_keys_exist_and_are_interned(self):
+        names = [n for n in dir(i18n_keys) if n.isupper()]
+        assert names
+        for locale in ("en", "es"):
+            catalog_keys = {k: k for k in _locales[locale]}
+            for name in names:
+                key = getattr(i18n_keys, name)
+                assert catalog_keys.get(key) is key, (locale, key)
+
     def test_t_unknown_key_returns_key(self):
         assert t("nonexistent.key") == "nonexistent.key"
 
+    def test_t_format_spec_and_conversion(self):
+        register_locale(
+            "en",
+            {"custom.spec": "{n:.2f} / {v!r} / {{literal}}", "custom.bad": "{0}"},
+        )
+        assert t("custom.spec", n=1, v="x") == "1.00 / 'x' / {literal}"
+        assert t("custom.spec", n=1) == "{n:.2f} / {v!r} / {{literal}}"
+        assert t("custom.bad", n=1) == "{0}"
+
+    def test_t_cache_distinguishes_value_types(self):
+        assert t("text.minlength", min=5) == "Minimum length is 5"
+        assert t("text.minlength", min=5.0) == "Minimum length is 5.0"
+        assert t("text.minlength", min=True) == "Minimum length is True"
+        assert t("text.minlength", min=1) == "Minimum length is 1"
+        assert t("text.minlength", min=Decimal("1.0")) == "Minimum length is 1.0"
+        assert t("text.minlength", min=Decimal("1.00")) == "Minimum length is 1.00"
+        assert t("text.minlength", min=0.0) == "Minimum length is 0.0"
+        assert t("text.minlength", min=-0.0) == "Minimum length is -0.0"
+        assert t("text.minlength", min=(1,)) == "Minimum length is (1,)"
+        assert t("text.minlength", min=(1.0,)) == "Minimum length is (1.0,)"
+
+    def test_t_cache_invalidated_by_register_locale(self):
+        assert t("text.minlength", min=3) == "Minimum length is 3"
+        register_locale("en", {"text.minlength": "At least {min} chars"})
+        try:
+            assert t("text.minlength", min=3) == "At least 3 chars"
+        finally:
+            register_locale("en", {"text.minlength": "Minimum length is {min}"})
+
+    def test_t_unhashable_kwargs(self):
+        assert t("select.invalid_values", values=["a"]) == "Invalid values: ['a']"
+
     def test_t_fallback_to_english(self):
         register_locale("pt", {"field.required": "Campo obrigatório"})
         set_locale("pt")
@@ -112,73 +193,27 @@ class TestTranslationFunction:
 # ---------------------------------------------------------------------------
 
 
-class TestEnglishMessages:
-    def test_form_validate_data_required_field(self):
-        form = Form(
-            name="test",
-            fields=[TextField(name="name", label="Name", required=True)],
-        )
-        result = form.validate_data({"other": "value"})
-        assert result["success"] is False
-        assert "The field name is required" in result["errors"][0]["message"]
-
-    def test_form_validate_data_success_message(self):
-        form = Form(
-            name="test",
-            fields=[TextField(name="name", label="Name", required=False)],
-        )
-        result = form.validate_data({"name": "Alice"})
-        assert result["success"] is True
-        assert result["message"] == "Data validated successfully"
-
-    def test_validate_form_data_required_field(self):
-        form = Form(
+@pytest.fixture(scope="module")
+def message_forms():
+    """One form per field shape, shared by the English and Spanish cases."""
+    return {
+        "required": Form(
             name="test",
             fields=[TextField(name="name", label="Name", required=True)],
-        )
-        result = validate_form_data(form, {})
-        assert result["success"] is False
-        assert "The field name is required" in result["errors"][0]["message"]
-        assert result["message"] == "Data validation error"
-
-    def test_validate_form_data_success(self):
-        form = Form(
+        ),
+        "optional": Form(
             name="test",
             fields=[TextField(name="name", label="Name")],
-        )
-        result = validate_form_data(form, {"name": "Bob"})
-        assert result["success"] is True
-        assert result["message"] == "Data validated successfully"
-
-    def test_email_invalid(self):
-        form = Form(
+        ),
+        "email": Form(
             name="test",
             fields=[EmailField(name="email", label="Email", required=True)],
-        )
-        result = form.validate_data({"email": "not-an-email"})
-        assert result["success"] is False
-        assert result["errors"][0]["message"] == "Invalid email"
-
-    def test_number_min_value(self):
-        form = Form(
+        ),
+        "number": Form(
             name="test",
             fields=[NumberField(name="age", label="Age", min_value=18)],
-        )
-        result = form.validate_data({"age": "10"})
-        assert result["success"] is False
-        assert "greater than or equal to 18" in result["errors"][0]["message"]
-
-    def test_number_invalid(self):
-        form = Form(
-            name="test",
-            fields=[NumberField(name="age", label="Age")],
-        )
-        result = form.validate_data({"age": "abc"})
-        assert result["success"] is False
-        assert "valid number" in result["errors"][0]["message"]
-
-    def test_select_invalid_option(self):
-        form = Form(
+        ),
+        "select": Form(
             name="test",
             fields=[
                 SelectField(
@@ -190,22 +225,12 @@ class TestEnglishMessages:
                     ],
                 )
             ],
-        )
-        result = form.validate_data({"color": "green"})
-        assert result["success"] is False
-        assert "Invalid option selected" in result["errors"][0]["message"]
-
-    def test_checkbox_must_be_boolean(self):
-        form = Form(
+        ),
+        "checkbox": Form(
             name="test",
             fields=[CheckboxField(name="agree", label="Agree")],
-        )
-        result = form.validate_data({"agree": "yes"})
-        assert result["success"] is False
-        assert "boolean" in result["errors"][0]["message"]
-
-    def test_radio_invalid_option(self):
-        form = Form(
+        ),
+        "radio": Form(
             name="test",
             fields=[
                 RadioField(
@@ -217,10 +242,43 @@ class TestEnglishMessages:
                     ],
                 )
             ],
-        )
-        result = form.validate_data({"size": "xl"})
+        ),
+    }
+
+
+class TestEnglishMessages:
+    @pytest.mark.parametrize(
+        "form_key,data,expected",
+        [
+            ("required", {"other": "value"}, "The field name is required"),
+            ("number", {"age": "10"}, "greater than or equal to 18"),
+            ("number", {"age": "abc"}, "valid number"),
+            ("select", {"color": "green"}, "Invalid option selected"),
+            ("checkbox", {"agree": "yes"}, "boolean"),
+            ("radio", {"size": "xl"}, "Invalid option selected"),
+        ],
+    )
+    def test_form_validate_data_error(self, message_forms, form_key, data, expected):
+        result = message_forms[form_key].validate_data(data)
         assert result["success"] is False
-        assert "Invalid option selected" in result["errors"][0]["message"]
+        assert expected in result["errors"][0]["message"]
+
+    def test_email_invalid_exact_message(self, message_forms):
+        result = message_forms["email"].validate_data({"email": "not-an-email"})
+        assert result["success"] is False
+        assert result["errors"][0]["message"] == "Invalid email"
+
+    @pytest.mark.parametrize("validate", [Form.validate_data, validate_form_data])
+    def test_success_message(self, message_forms, validate):
+        result = validate(message_forms["optional"], {"name": "Alice"})
+        assert result["success"] is True
+        assert result["message"] == "Data validated successfully"
+
+    def test_validate_form_data_required_field(self, message_forms):
+        result = validate_form_data(message_forms["required"], {})
+        assert result["success"] is False
+        assert "The field name is required" in result["errors"][0]["message"]
+        assert result["message"] == "Data validation error"
 
 
 # ---------------------------------------------------------------------------
@@ -229,56 +287,37 @@ class TestEnglishMessages:
 
 
 class TestSpanishMessages:
-    def test_form_validate_data_required_field_es(self):
-        set_locale("es")
-        form = Form(
-            name="test",
-            fields=[TextField(name="nombre", label="Nombre", required=True)],
-        )
-        result = form.validate_data({})
-        assert result["success"] is False
-        assert "El campo nombre es requerido" in result["errors"][0]["message"]
-
-    def test_form_validate_data_success_es(self):
+    @pytest.fixture(autouse=True)
+    def spanish(self):
         set_locale("es")
-        form = Form(
-            name="test",
-            fields=[TextField(name="nombre", label="Nombre")],
-        )
-        result = form.validate_data({"nombre": "Ana"})
-        assert result["success"] is True
-        assert result["message"] == "Datos validados correctamente"
 
-    def test_validate_form_data_required_es(self):
-        set_locale("es")
-        form = Form(
-            name="test",
-            fields=[TextField(name="nombre", label="Nombre", required=True)],
-        )
-        result = validate_form_data(form, {})
+    @pytest.mark.parametrize(
+        "form_key,data,expected",
+        [
+            ("required", {}, "El campo name es requerido"),
+            ("number", {"age": "5"}, "mayor o igual a 18"),
+        ],
+    )
+    def test_form_validate_data_error_es(self, message_forms, form_key, data, expected):
+        result = message_forms[form_key].validate_data(data)
         assert result["success"] is False
-        assert "El campo nombre es requerido" in result["errors"][0]["message"]
-        assert result["message"] == "Error en la validación de datos"
+        assert expected in result["errors"][0]["message"]
 
-    def test_email_invalid_es(self):
-        set_locale("es")
-        form = Form(
-            name="test",
-            fields=[EmailField(name="email", label="Email", required=True)],
-        )
-        result = form.validate_data({"email": "bad"})
+    def test_email_invalid_exact_message_es(self, message_forms):
+        result = message_forms["email"].validate_data({"email": "bad"})
         assert result["success"] is False
         assert result["errors"][0]["message"] == "Email inválido"
 
-    def test_number_min_value_es(self):
-        set_locale("es")
-        form = Form(
-            name="test",
-            fields=[NumberField(name="edad", label="Edad", min_value=18)],
-        )
-        result = form.validate_data({"edad": "5"})
+    def test_form_validate_data_success_es(self, message_forms):
+        result = message_forms["optional"].validate_data({"name": "Ana"})
+        assert result["success"] is True
+        assert result["message"] == "Datos validados correctamente"
+
+    def test_validate_form_data_required_es(self, message_forms):
+        result = validate_form_data(message_forms["required"], {})
         assert result["success"] is False
-        assert "mayor o igual a 18" in result["errors"][0]["message"]
+        assert "El campo name es requerido" in result["errors"][0]["message"]
+        assert result["message"] == "Error en la validación de datos"
 
 
 # ---------------------------------------------------------------------------
@@ -325,6 +364,17 @@ class TestFieldValidatorMessages:
         assert not ok
         assert msg == "Value does not match the required pattern"
 
+    def test_text_field_pattern_compiled_once(self):
+        from codeforms.fields import _compile_pattern
+
+        a = TextField(name="a", label="A", pattern=r"^[a-z]{2}\d+$")
+        b = TextField(name="b", label="B", pattern=r"^[a-z]{2}\d+$")
+        misses = _compile_pattern.cache_info().misses
+        assert a.validate_value("ab12") == (True, None)
+        assert not b.validate_value("12ab")[0]
+        assert _compile_pattern.cache_info().misses == misses
+        assert _compile_pattern.cache_info().maxsize is not None
+
     def test_checkbox_default_must_be_boolean_en(self):
         with pytest.raises(Exception, match="boolean"):
             CheckboxField(name="x", label="X", default_value="nope")
@@ -364,6 +414,8 @@ class TestFieldValidatorMessages:
     def test_text_invalid_regex_en(self):
         with pytest.raises(Exception, match="regex"):
             TextField(name="x", label="X", pattern="[invalid")
+        with pytest.raises(Exception, match="regex"):
+            TextField(name="y", label="Y", pattern="[invalid")
 
     def test_field_group_unique_names_en(self):
         with pytest.raises(Exception, match="unique"):
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from codeforms import (
     CheckboxField,
     CheckboxGroupField,
@@ -13,7 +15,6 @@ from codeforms import (
     FieldGroup,
     FileField,
     Form,
-    FormStep,
     HiddenField,
     ListField,
     NumberField,
@@ -27,22 +28,49 @@ from codeforms import (
 )
 
 
+# Shared read-only forms: form_to_json_schema does not mutate its input, so
+# each shape is built once per module.
+
+
+@pytest.fixture(scope="module")
+def single_text_form():
+    return Form(name="t", fields=[TextField(name="x", label="X")])
+
+
+@pytest.fixture(scope="module")
+def single_number_form():
+    return Form(name="t", fields=[NumberField(name="n", label="N")])
+
+
+@pytest.fixture(scope="module")
+def select_two_opts_form():
+    return Form(
+        name="t",
+        fields=[
+            SelectField(
+                name="s",
+                label="S",
+                options=[
+                    SelectOption(value="a", label="A"),
+                    SelectOption(value="b", label="B"),
+                ],
+            )
+        ],
+    )
+
+
 # ---------------------------------------------------------------------------
 # Top-level schema structure
 # ---------------------------------------------------------------------------
 
 
 class TestSchemaStructure:
-    def test_basic_schema_structure(self):
-        form = Form(
-            name="test",
-            fields=[TextField(name="x", label="X")],
-        )
-        schema = form_to_json_schema(form)
+    def test_basic_schema_structure(self, single_text_form, cached_schema):
+        schema = cached_schema(single_text_form)
 
         assert schema["$schema"] == "http://json-schema.org/draft-07/schema#"
         assert schema["type"] == "object"
-        assert schema["title"] == "test"
+        assert schema["title"] == "t"
         assert "properties" in schema
         assert schema["additionalProperties"] is False
 
@@ -58,12 +86,10 @@ class TestSchemaStructure:
 
         assert schema["required"] == ["a"]
 
-    def test_required_key_absent_when_no_required_fields(self):
-        form = Form(
-            name="test",
-            fields=[TextField(name="a", label="A")],
-        )
-        schema = form_to_json_schema(form)
+    def test_required_key_absent_when_no_required_fields(
+        self, single_text_form, cached_schema
+    ):
+        schema = cached_schema(single_text_form)
 
         assert "required" not in schema
 
@@ -77,10 +103,17 @@ class TestSchemaStructure:
             ],
         )
         schema = form_to_json_schema(form)
-        json_str = json.dumps(schema)
-        roundtrip = json.loads(json_str)
 
-        assert roundtrip == schema
+        json.dumps(schema)  # must not raise
+
+    @pytest.mark.parametrize(
+        "form_fixture",
+        ["single_text_form", "single_number_form", "select_two_opts_form"],
+    )
+    def test_roundtrip_equals_original(self, request, form_fixture, cached_schema):
+        schema = cached_schema(request.getfixturevalue(form_fixture))
+
+        assert json.loads(json.dumps(schema)) == schema
 
 
 # ---------------------------------------------------------------------------
@@ -89,12 +122,8 @@ class TestSchemaStructure:
 
 
 class TestTextFieldSchema:
-    def test_basic_text_field(self):
-        form = Form(
-            name="t",
-            fields=[TextField(name="x", label="X")],
-        )
-        prop = form_to_json_schema(form)["properties"]["x"]
+    def test_basic_text_field(self, single_text_form, cached_schema):
+        prop = cached_schema(single_text_form)["properties"]["x"]
 
         assert prop["type"] == "string"
         assert prop["title"] == "X"
@@ -118,12 +147,8 @@ class TestTextFieldSchema:
         assert prop["maxLength"] == 50
         assert prop["pattern"] == "^[a-z]+$"
 
-    def test_text_field_no_constraints(self):
-        form = Form(
-            name="t",
-            fields=[TextField(name="x", label="X")],
-        )
-        prop = form_to_json_schema(form)["properties"]["x"]
+    def test_text_field_no_constraints(self, single_text_form, cached_schema):
+        prop = cached_schema(single_text_form)["properties"]["x"]
 
         assert "minLength" not in prop
         assert "maxLength" not in prop
@@ -131,20 +156,45 @@ class TestTextFieldSchema:
 
 
 # ---------------------------------------------------------------------------
-# EmailField
+# Simple field types (one property, a few keys)
 # ---------------------------------------------------------------------------
 
 
-class TestEmailFieldSchema:
-    def test_email_field(self):
-        form = Form(
-            name="t",
-            fields=[EmailField(name="email", label="Email")],
-        )
-        prop = form_to_json_schema(form)["properties"]["email"]
+FIELD_CASES = [
+    pytest.param(
+        lambda: EmailField(name="email", label="Email"),
+        {"type": "string", "format": "email"},
+        id="email",
+    ),
+    pytest.param(
+        lambda: DateField(name="d", label="D"),
+        {"type": "string", "format": "date"},
+        id="date",
+    ),
+    pytest.param(
+        lambda: HiddenField(name="h", label="H"),
+        {"type": "string"},
+        id="hidden",
+    ),
+    pytest.param(
+        lambda: UrlField(name="u", label="U", minlength=10, maxlength=200),
+        {"type": "string", "format": "uri", "minLength": 10, "maxLength": 200},
+        id="url",
+    ),
+    pytest.param(
+        lambda: TextareaField(name="ta", label="TA", minlength=5, maxlength=500),
+        {"type": "string", "minLength": 5, "maxLength": 500},
+        id="textarea",
+    ),
+]
 
-        assert prop["type"] == "string"
-        assert prop["format"] == "email"
+
+@pytest.mark.parametrize("make_field,expected", FIELD_CASES)
+def test_field_schema(make_field, expected):
+    field = make_field()
+    prop = form_to_json_schema(Form(name="t", fields=[field]))["properties"][field.name]
+
+    assert expected.items() <= prop.items()
 
 
 # ---------------------------------------------------------------------------
@@ -173,12 +223,8 @@ class TestNumberFieldSchema:
         assert prop["maximum"] == 100
         assert prop["multipleOf"] == 0.5
 
-    def test_number_field_no_constraints(self):
-        form = Form(
-            name="t",
-            fields=[NumberField(name="n", label="N")],
-        )
-        prop = form_to_json_schema(form)["properties"]["n"]
+    def test_number_field_no_constraints(self, single_number_form, cached_schema):
+        prop = cached_schema(single_number_form)["properties"]["n"]
 
         assert prop["type"] == "number"
         assert "minimum" not in prop
@@ -186,44 +232,14 @@ class TestNumberFieldSchema:
         assert "multipleOf" not in prop
 
 
-# ---------------------------------------------------------------------------
-# DateField
-# ---------------------------------------------------------------------------
-
-
-class TestDateFieldSchema:
-    def test_date_field(self):
-        form = Form(
-            name="t",
-            fields=[DateField(name="d", label="D")],
-        )
-        prop = form_to_json_schema(form)["properties"]["d"]
-
-        assert prop["type"] == "string"
-        assert prop["format"] == "date"
-
-
 # ---------------------------------------------------------------------------
 # SelectField
 # ---------------------------------------------------------------------------
 
 
 class TestSelectFieldSchema:
-    def test_single_select(self):
-        form = Form(
-            name="t",
-            fields=[
-                SelectField(
-                    name="s",
-                    label="S",
-                    options=[
-                        SelectOption(value="a", label="A"),
-                        SelectOption(value="b", label="B"),
-                    ],
-                )
-            ],
-        )
-        prop = form_to_json_schema(form)["properties"]["s"]
+    def test_single_select(self, select_two_opts_form, cached_schema):
+        prop = cached_schema(select_two_opts_form)["properties"]["s"]
 
         assert prop["type"] == "string"
         assert prop["enum"] == ["a", "b"]
@@ -344,61 +360,6 @@ class TestFileFieldSchema:
         assert prop["items"] == {"type": "string", "contentEncoding": "base64"}
 
 
-# ---------------------------------------------------------------------------
-# HiddenField
-# ---------------------------------------------------------------------------
-
-
-class TestHiddenFieldSchema:
-    def test_hidden_field(self):
-        form = Form(
-            name="t",
-            fields=[HiddenField(name="h", label="H")],
-        )
-        prop = form_to_json_schema(form)["properties"]["h"]
-
-        assert prop["type"] == "string"
-
-
-# ---------------------------------------------------------------------------
-# UrlField
-# ---------------------------------------------------------------------------
-
-
-class TestUrlFieldSchema:
-    def test_url_field(self):
-        form = Form(
-            name="t",
-            fields=[UrlField(name="u", label="U", minlength=10, maxlength=200)],
-        )
-        prop = form_to_json_schema(form)["properties"]["u"]
-
-        assert prop["type"] == "string"
-        assert prop["format"] == "uri"
-        assert prop["minLength"] == 10
-        assert prop["maxLength"] == 200
-
-
-# ---------------------------------------------------------------------------
-# TextareaField
-# ---------------------------------------------------------------------------
-
-
-class TestTextareaFieldSchema:
-    def test_textarea_field(self):
-        form = Form(
-            name="t",
-            fields=[
-                TextareaField(name="ta", label="TA", minlength=5, maxlength=500)
-            ],
-        )
-        prop = form_to_json_schema(form)["properties"]["ta"]
-
-        assert prop["type"] == "string"
-        assert prop["minLength"] == 5
-        assert prop["maxLength"] == 500
-
-
 # ---------------------------------------------------------------------------
 # ListField
 # ---------------------------------------------------------------------------
@@ -554,27 +515,10 @@ class TestFieldGroupAndStepFlattening:
 
         assert set(schema["properties"].keys()) == {"first", "last", "email"}
 
-    def test_fields_inside_steps_are_included(self):
-        form = Form(
-            name="wizard",
-            content=[
-                FormStep(
-                    title="Step 1",
-                    content=[
-                        TextField(name="name", label="Name", required=True),
-                    ],
-                ),
-                FormStep(
-                    title="Step 2",
-                    content=[
-                        EmailField(name="email", label="Email", required=True),
-                    ],
-                ),
-            ],
-        )
-        schema = form_to_json_schema(form)
+    def test_fields_inside_steps_are_included(self, two_step_form, cached_schema):
+        schema = cached_schema(two_step_form)
 
-        assert set(schema["properties"].keys()) == {"name", "email"}
+        assert set(schema["properties"].keys()) == {"name", "email", "notes"}
         assert schema["required"] == ["name", "email"]
 
 
@@ -636,5 +580,4 @@ class TestFullFormSchema:
         assert schema["properties"]["terms"]["type"] == "boolean"
         assert schema["properties"]["plan"]["enum"] == ["free", "pro"]
 
-        json_str = json.dumps(schema, indent=2)
-        assert json.loads(json_str) == schema
+        json.dumps(schema, indent=2)  # must not raise
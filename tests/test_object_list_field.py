@@ -126,6 +126,39 @@ class TestObjectListFieldValidation:
             }
         ]
 
+    def test_allowed_keys_follow_replaced_subfields(self):
+        form = build_form()
+        item = {"approver_email": "ana@empresa.com", "label": "Compras", "area": "X"}
+
+        first = validate_form_data(form, {"parallel_approvals": [item]})
+        form.fields[0].fields = form.fields[0].fields + [
+            TextField(name="area", label="Area")
+        ]
+        second = validate_form_data(form, {"parallel_approvals": [item]})
+
+        assert first["errors"] == [
+            {"field": "parallel_approvals[0]", "message": "Unknown fields: area"}
+        ]
+        assert second["success"] is True
+        assert second["data"]["parallel_approvals"][0]["area"] == "X"
+
+    def test_allowed_keys_follow_subfields_appended_in_place(self):
+        form = build_form()
+        item = {"approver_email": "ana@empresa.com", "label": "Compras", "area": "X"}
+
+        validate_form_data(form, {"parallel_approvals": [item]})
+        form.fields[0].fields.append(TextField(name="area", label="Area"))
+        result = validate_form_data(form, {"parallel_approvals": [item]})
+
+        assert result["success"] is True
+        assert result["data"]["parallel_approvals"][0]["area"] == "X"
+
+    def test_validation_keeps_form_equal_to_its_json_roundtrip(self):
+        form = build_form()
+        form.validate_data({"parallel_approvals": [{"unexpected": 1}]})
+
+        assert form == Form.loads(form.model_dump_json())
+
 
 class TestObjectListFieldSchema:
     def test_json_schema_exports_array_of_objects(self):
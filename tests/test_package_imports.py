@@ -0,0 +1,61 @@
+"""Tests for the lazy public namespace in codeforms/__init__.py."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import codeforms
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _modules_after(statement: str) -> set[str]:
+    code = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(SRC)!r})\n"
+        f"{statement}\n"
+        "print('\\n'.join(sorted(sys.modules)))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(out.split())
+
+
+def test_import_codeforms_does_not_load_pydantic():
+    modules = _modules_after("import codeforms")
+    assert "pydantic" not in modules
+    assert "codeforms.i18n" in modules
+
+
+def test_field_import_does_not_load_forms_or_export():
+    modules = _modules_after("from codeforms import TextField")
+    assert "codeforms.fields" in modules
+    assert "codeforms.forms" not in modules
+    assert "codeforms.export" not in modules
+
+
+def test_all_public_names_resolve():
+    for name in codeforms.__all__:
+        assert getattr(codeforms, name) is not None
+
+
+def test_submodules_reachable_as_attributes():
+    # Would raise AttributeError (and fail the subprocess) if not resolvable
+    modules = _modules_after(
+        "import codeforms; codeforms.fields, codeforms.forms, codeforms.export"
+    )
+    assert {"codeforms.fields", "codeforms.forms", "codeforms.export"} <= modules
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        codeforms.DoesNotExist  # noqa: B018
+
+
+def test_dir_lists_lazy_names():
+    assert "Form" in dir(codeforms)
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from codeforms import (
     EmailField,
     FieldGroup,
@@ -57,30 +59,9 @@ class TestFormConstruction:
         assert len(form.fields) == 3
         assert [f.name for f in form.fields] == ["a", "b", "c"]
 
-    def test_form_fields_flattens_steps(self):
-        form = Form(
-            name="test",
-            content=[
-                FormStep(
-                    title="Step 1",
-                    content=[
-                        TextField(name="a", label="A"),
-                    ],
-                ),
-                FormStep(
-                    title="Step 2",
-                    content=[
-                        TextField(name="b", label="B"),
-                        FieldGroup(
-                            title="Inner",
-                            fields=[TextField(name="c", label="C")],
-                        ),
-                    ],
-                ),
-            ],
-        )
-        assert len(form.fields) == 3
-        assert [f.name for f in form.fields] == ["a", "b", "c"]
+    def test_form_fields_flattens_steps(self, two_step_form):
+        assert len(two_step_form.fields) == 3
+        assert [f.name for f in two_step_form.fields] == ["name", "email", "notes"]
 
     def test_form_fields_mixed_content(self):
         """Bare fields + groups + steps in the same form."""
@@ -105,6 +86,55 @@ class TestFormConstruction:
 # JSON roundtrip backward compat
 # ---------------------------------------------------------------------------
 
+# Each representative form is dumped once per module; the tests only load.
+
+
+@pytest.fixture(scope="module")
+def legacy_json_blob():
+    return Form(
+        name="roundtrip",
+        fields=[
+            TextField(name="name", label="Name", required=True),
+            EmailField(name="email", label="Email"),
+        ],
+    ).model_dump_json()
+
+
+@pytest.fixture(scope="module")
+def fieldgroup_json_blob():
+    return Form(
+        name="groups",
+        content=[
+            FieldGroup(
+                title="Info",
+                fields=[
+                    TextField(name="a", label="A"),
+                    TextField(name="b", label="B"),
+                ],
+            )
+        ],
+    ).model_dump_json()
+
+
+@pytest.fixture(scope="module")
+def visibility_json_blob():
+    return Form(
+        name="dynamic",
+        fields=[
+            TextField(
+                name="country",
+                label="Country",
+            ),
+            TextField(
+                name="state",
+                label="State",
+                visible_when=[
+                    VisibilityRule(field="country", operator="equals", value="US")
+                ],
+            ),
+        ],
+    ).model_dump_json()
+
 
 class TestJsonRoundtrip:
     def test_legacy_payload_loads_unchanged(self):
@@ -120,70 +150,40 @@ class TestJsonRoundtrip:
         assert len(form.fields) == 2
         assert isinstance(form.fields[0], TextField)
 
-    def test_legacy_payload_json_roundtrip(self):
-        form = Form(
-            name="roundtrip",
-            fields=[
-                TextField(name="name", label="Name", required=True),
-                EmailField(name="email", label="Email"),
-            ],
-        )
-        json_str = form.model_dump_json()
-        restored = Form.model_validate_json(json_str)
+    def test_legacy_payload_json_roundtrip(self, legacy_json_blob):
+        restored = Form.model_validate_json(legacy_json_blob)
         assert restored.name == "roundtrip"
         assert len(restored.fields) == 2
         assert isinstance(restored.fields[0], TextField)
         assert isinstance(restored.fields[1], EmailField)
 
-    def test_fieldgroup_json_roundtrip(self):
-        form = Form(
-            name="groups",
-            content=[
-                FieldGroup(
-                    title="Info",
-                    fields=[
-                        TextField(name="a", label="A"),
-                        TextField(name="b", label="B"),
-                    ],
-                )
-            ],
-        )
-        json_str = form.model_dump_json()
-        restored = Form.model_validate_json(json_str)
+    def test_fieldgroup_json_roundtrip(self, fieldgroup_json_blob):
+        restored = Form.model_validate_json(fieldgroup_json_blob)
         assert len(restored.content) == 1
         assert isinstance(restored.content[0], FieldGroup)
         assert len(restored.fields) == 2
 
-    def test_new_fields_serialized_and_restored(self):
+    def test_new_fields_serialized_and_restored(self, visibility_json_blob):
         """visible_when metadata survives roundtrip."""
-        form = Form(
-            name="dynamic",
-            fields=[
-                TextField(
-                    name="country",
-                    label="Country",
-                ),
-                TextField(
-                    name="state",
-                    label="State",
-                    visible_when=[
-                        VisibilityRule(field="country", operator="equals", value="US")
-                    ],
-                ),
-            ],
-        )
-        json_str = form.model_dump_json()
-        data = json.loads(json_str)
+        data = json.loads(visibility_json_blob)
         # visible_when must be in the serialized data
         state_data = data["content"][1]
         assert state_data["visible_when"] is not None
         assert state_data["visible_when"][0]["field"] == "country"
 
         # Restore
-        restored = Form.model_validate_json(json_str)
+        restored = Form.model_validate_json(visibility_json_blob)
         assert restored.fields[1].visible_when is not None
         assert restored.fields[1].visible_when[0].operator == "equals"
 
+    def test_roundtrip_still_equal_after_visibility_evaluation(
+        self, visibility_json_blob
+    ):
+        form = Form.model_validate_json(visibility_json_blob)
+        form.get_visible_fields({"country": "US"})
+
+        assert form == Form.loads(form.model_dump_json())
+
 
 # ---------------------------------------------------------------------------
 # Validation backward compat
@@ -265,38 +265,42 @@ class TestExportCompat:
 # ---------------------------------------------------------------------------
 
 
-class TestCustomFieldRegistryCompat:
-    def setup_method(self):
-        class TagField(FormFieldBase):
-            field_type: str = "tag"
-            max_tags: int = 5
+@pytest.fixture(scope="session")
+def tag_field_cls():
+    """A custom field type, registered once (registration is idempotent per class)."""
 
-        register_field_type(TagField)
-        self.TagField = TagField
+    class TagField(FormFieldBase):
+        field_type: str = "tag"
+        max_tags: int = 5
 
-    def test_custom_field_in_form_step(self):
+    register_field_type(TagField)
+    return TagField
+
+
+class TestCustomFieldRegistryCompat:
+    def test_custom_field_in_form_step(self, tag_field_cls):
         form = Form(
             name="test",
             content=[
                 FormStep(
                     title="Step 1",
                     content=[
-                        self.TagField(name="tags", label="Tags"),
+                        tag_field_cls(name="tags", label="Tags"),
                     ],
                 )
             ],
         )
         assert len(form.fields) == 1
-        assert isinstance(form.fields[0], self.TagField)
+        assert isinstance(form.fields[0], tag_field_cls)
 
-    def test_custom_field_json_roundtrip_with_step(self):
+    def test_custom_field_json_roundtrip_with_step(self, tag_field_cls):
         form = Form(
             name="test",
             content=[
                 FormStep(
                     title="Step 1",
                     content=[
-                        self.TagField(name="tags", label="Tags", max_tags=10),
+                        tag_field_cls(name="tags", label="Tags", max_tags=10),
                     ],
                 )
             ],
@@ -179,6 +179,35 @@ class TestResolveContentItem:
         with pytest.raises(ValueError, match="Unknown field type"):
             resolve_content_item(item)
 
+    def test_repeated_resolution_reuses_cached_class_lookup(self):
+        from codeforms.registry import _resolve_class
+
+        resolve_content_item({"field_type": "phone", "name": "p", "label": "P"})
+        misses = _resolve_class.cache_info().misses
+
+        for i in range(5):
+            item = {"field_type": "phone", "name": f"p{i}", "label": "P"}
+            assert isinstance(resolve_content_item(item), PhoneField)
+
+        assert _resolve_class.cache_info().misses == misses
+
+    def test_resolution_refreshed_after_registration(self):
+        class SliderField(FormFieldBase):
+            field_type: str = "slider"
+
+        class RangeSliderField(FormFieldBase):
+            field_type: str = "slider"
+            upper: int = 100
+
+        item = {"field_type": "slider", "name": "s", "label": "S", "upper": 5}
+        register_field_type(SliderField)
+        assert isinstance(resolve_content_item(item), SliderField)
+
+        register_field_type(RangeSliderField)
+        result = resolve_content_item(item)
+        assert isinstance(result, RangeSliderField)
+        assert result.upper == 5
+
 
 # ---------------------------------------------------------------------------
 # Form with custom field types
@@ -391,6 +420,17 @@ class TestFieldTypeValue:
         html = field.export("html")
         assert 'type="phone"' in html
 
+    def test_field_type_value_follows_field_type_changes(self):
+        field = TextField(name="x", label="X")
+        assert field.field_type_value == "text"
+
+        field.field_type = FieldType.PASSWORD
+        assert field.field_type_value == "password"
+
+        copied = field.model_copy(update={"field_type": "custom"})
+        assert copied.field_type_value == "custom"
+        assert "field_type_value" not in field.model_dump()
+
 
 # ---------------------------------------------------------------------------
 # Backward compatibility
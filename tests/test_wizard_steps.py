@@ -53,6 +53,16 @@ class TestFormStepModel:
         assert len(step.fields) == 3
         assert [f.name for f in step.fields] == ["a", "b", "c"]
 
+    def test_nested_instances_are_not_copied(self):
+        field = TextField(name="a", label="A")
+        group = FieldGroup(title="Group", fields=[field])
+        step = FormStep(title="Step", content=[group])
+        form = Form(name="wizard", content=[step])
+
+        assert form.content[0] is step
+        assert step.content[0] is group
+        assert group.fields[0] is field
+
     def test_default_values(self):
         step = FormStep(title="S", content=[])
         assert step.type == "step"
@@ -309,6 +319,45 @@ class TestStepWithVisibility:
         )
         assert result["success"] is False
 
+    def test_visibility_rules_compiled_once_across_calls(self, monkeypatch):
+        from codeforms import forms
+
+        compiled = []
+        original = forms._compile_visibility_predicate
+
+        def counting(rules):
+            compiled.append(rules)
+            return original(rules)
+
+        monkeypatch.setattr(forms, "_VISIBILITY_CODEGEN", True)
+        monkeypatch.setattr(forms, "_compile_visibility_predicate", counting)
+        form = Form(
+            name="test",
+            content=[
+                FormStep(
+                    title="Step 1",
+                    content=[
+                        TextField(name="type", label="Type", required=True),
+                        TextField(
+                            name="detail",
+                            label="Detail",
+                            required=True,
+                            visible_when=[
+                                VisibilityRule(
+                                    field="type", operator="equals", value="other"
+                                ),
+                            ],
+                        ),
+                    ],
+                ),
+            ],
+        )
+
+        for value in ("standard", "other", "standard"):
+            form.validate_step(0, {"type": value, "detail": "x"})
+
+        assert len(compiled) == 1
+
 
 # ---------------------------------------------------------------------------
 # HTML export for wizard